@@ -0,0 +1,100 @@
+"""
+Shared pytest fixtures for the ToDoList test suite.
+
+Database tests run against the PostgreSQL server named by
+TEST_DATABASE_URL and are skipped when it is not set. The schema is
+created once per run and every test works inside a transaction that is
+rolled back afterwards.
+"""
+
+import os
+from typing import Iterator, List
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    Engine bound to a freshly created test schema.
+
+    Yields:
+        Engine: SQLAlchemy engine for TEST_DATABASE_URL
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    from sqlalchemy import create_engine, text
+
+    from todolist_app.db import Base
+    import todolist_app.models  # noqa: F401  (registers the tables)
+
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.begin() as conn:
+        # The trigram indexes on projects need pg_trgm
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        Base.metadata.create_all(conn)
+
+    yield engine
+
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """
+    Session whose work is rolled back when the test ends.
+
+    Repository commits only release a savepoint, so tests stay isolated.
+
+    Yields:
+        Session: SQLAlchemy session configured like an API request's
+    """
+    from sqlalchemy.orm import Session
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def query_counter(engine) -> Iterator[List[str]]:
+    """
+    Record every SQL statement sent to the test database.
+
+    Guards against N+1 regressions: clear the list, run the call under
+    test, then assert on its ``len()``.
+
+    Yields:
+        List[str]: Statements executed so far, in order
+    """
+    from sqlalchemy import event
+
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        # Savepoints come from db_session's isolation, not the code under test
+        if not statement.startswith(_SAVEPOINT_PREFIXES):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
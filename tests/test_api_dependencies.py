@@ -0,0 +1,34 @@
+"""
+Tests for the API's per-request database session dependency.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from todolist_app.api import dependencies
+
+
+@pytest.fixture
+def request_sessions(engine, monkeypatch):
+    """Point get_db at the test database."""
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(dependencies, "get_sessionmaker", lambda: factory)
+
+
+def test_get_db_gives_each_request_its_own_session(request_sessions):
+    # FastAPI may run setup and teardown on different threadpool workers
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = dependencies.get_db()
+        second = dependencies.get_db()
+        first_db = pool.submit(next, first).result()
+        second_db = pool.submit(next, second).result()
+
+        assert first_db is not second_db
+
+        # Ending one request leaves the other's session usable
+        pool.submit(first.close).result()
+        assert second_db.execute(text("SELECT 1")).scalar() == 1
+        pool.submit(second.close).result()
@@ -0,0 +1,34 @@
+"""
+Regression test for the CLI's lazy imports.
+
+Importing the CLI module must stay cheap: the database stack and Config
+(which reads .env) are loaded by TodoListCLI when it starts, not at import.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules the CLI module must not load at import time
+LAZY_MODULES = ("sqlalchemy", "dotenv", "todolist_app.utils.config")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_cli_import_does_not_load_database_or_config():
+    code = (
+        "import sys\n"
+        "import todolist_app.cli.main\n"
+        f"loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    # A fresh interpreter, so modules imported by other tests don't count
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
@@ -0,0 +1,55 @@
+"""
+Tests for the CLI main menu header.
+"""
+
+import sys
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import sessionmaker
+
+from todolist_app.db import session as session_module
+from todolist_app.models import Project
+
+# The package re-exports main(), which shadows the submodule attribute
+import todolist_app.cli.main
+
+cli_main = sys.modules["todolist_app.cli.main"]
+
+
+@pytest.fixture
+def cli(engine, monkeypatch):
+    """A TodoListCLI whose session uses the test database."""
+    factory = sessionmaker(bind=engine, autoflush=False)
+    monkeypatch.setattr(session_module, "get_sessionmaker", lambda: factory)
+    cli = cli_main.TodoListCLI()
+
+    yield cli
+
+    cli.db.close()
+    with factory() as db:
+        db.execute(delete(Project).where(Project.name == "Menu header"))
+        db.commit()
+
+
+class TestMenuHeader:
+    """Rendering the header leaves no transaction open at the prompt."""
+
+    def test_header_read_ends_its_transaction(self, cli, capsys):
+        cli.current_project_id = cli.project_service.create_project(
+            "Menu header"
+        ).id
+        cli.db.commit()
+
+        cli._display_main_menu()
+
+        assert "Menu header" in capsys.readouterr().out
+        assert not cli.db.in_transaction()
+
+    def test_deleted_project_is_deselected(self, cli, capsys):
+        cli.current_project_id = 999_999
+
+        cli._display_main_menu()
+
+        assert cli.current_project_id is None
+        assert not cli.db.in_transaction()
@@ -0,0 +1,42 @@
+"""
+Tests for engine creation in todolist_app.db.session.
+"""
+
+import pytest
+
+from todolist_app.db import session as session_module
+from todolist_app.db.session import get_engine
+from todolist_app.utils.config import Config
+
+
+@pytest.fixture(autouse=True)
+def fresh_engines(monkeypatch):
+    """Build engines for a dummy URL (nothing connects) and drop them after."""
+    monkeypatch.setattr(Config, "DATABASE_URL", "postgresql://user@localhost/db")
+    Config.get_database_url.cache_clear()
+    session_module._create_engine.cache_clear()
+
+    yield
+
+    session_module._create_engine.cache_clear()
+    Config.get_database_url.cache_clear()
+
+
+class TestGetEngine:
+    """Engines are shared per pre-ping setting."""
+
+    def test_default_follows_config(self, monkeypatch):
+        monkeypatch.setattr(Config, "DB_POOL_PRE_PING", False)
+
+        assert get_engine() is get_engine(pool_pre_ping=False)
+        assert get_engine().pool._pre_ping is False
+
+    def test_explicit_pre_ping_overrides_config(self, monkeypatch):
+        monkeypatch.setattr(Config, "DB_POOL_PRE_PING", False)
+
+        engine = get_engine(pool_pre_ping=True)
+
+        assert engine.pool._pre_ping is True
+        assert engine is not get_engine()
+        # The setting itself is left alone
+        assert Config.DB_POOL_PRE_PING is False
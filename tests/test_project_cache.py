@@ -0,0 +1,108 @@
+"""
+Tests for the transaction-scoped project caches of ProjectService.
+"""
+
+from sqlalchemy import text
+
+from todolist_app.services.project_service import (
+    PROJECT_CACHE_KEY,
+    PROJECT_LIST_CACHE_KEY,
+    ProjectService,
+)
+
+
+class TestProjectCache:
+    """Cached projects do not outlive the transaction that loaded them."""
+
+    def test_get_project_by_id_cached_within_transaction(
+        self, db_session, query_counter
+    ):
+        service = ProjectService(db_session)
+        project_id = service.create_project("Cached").id
+        query_counter.clear()
+
+        first = service.get_project_by_id(project_id)
+        second = service.get_project_by_id(project_id)
+
+        assert first is second
+        assert len(query_counter) == 1
+
+    def test_get_project_by_id_cache_cleared_on_commit(self, db_session):
+        service = ProjectService(db_session)
+        project_id = service.create_project("Cached").id
+        service.get_project_by_id(project_id)
+        assert project_id in db_session.info[PROJECT_CACHE_KEY]
+
+        db_session.commit()
+
+        assert PROJECT_CACHE_KEY not in db_session.info
+
+    def test_get_project_by_id_cache_cleared_on_rollback(self, db_session):
+        service = ProjectService(db_session)
+        project_id = service.create_project("Cached").id
+        service.get_project_by_id(project_id)
+
+        db_session.rollback()
+
+        assert PROJECT_CACHE_KEY not in db_session.info
+
+    def test_get_project_by_id_cache_cleared_on_close(self, db_session):
+        service = ProjectService(db_session)
+        project_id = service.create_project("Cached").id
+        service.get_project_by_id(project_id)
+
+        db_session.close()
+
+        assert PROJECT_CACHE_KEY not in db_session.info
+
+    def test_get_project_by_id_cache_kept_across_savepoint(self, db_session):
+        service = ProjectService(db_session)
+        project_id = service.create_project("Cached").id
+        service.get_project_by_id(project_id)
+
+        with db_session.begin_nested():
+            pass
+
+        assert project_id in db_session.info[PROJECT_CACHE_KEY]
+
+    def test_get_all_projects_cache_cleared_on_commit(self, db_session):
+        service = ProjectService(db_session)
+        service.create_project("Listed")
+        service.get_all_projects()
+        assert PROJECT_LIST_CACHE_KEY in db_session.info
+
+        db_session.commit()
+
+        assert PROJECT_LIST_CACHE_KEY not in db_session.info
+
+    def test_get_all_projects_cache_cleared_on_close(self, db_session):
+        service = ProjectService(db_session)
+        service.create_project("Listed")
+        service.get_all_projects()
+
+        db_session.close()
+
+        assert PROJECT_LIST_CACHE_KEY not in db_session.info
+
+    def test_get_all_projects_sees_rows_written_elsewhere(
+        self, engine, db_session
+    ):
+        service = ProjectService(db_session)
+        before = len(service.get_all_projects())
+        db_session.commit()
+
+        # Written through another connection, bypassing the service
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO projects (name, created_at) "
+                    "VALUES ('Written elsewhere', now())"
+                )
+            )
+        try:
+            assert len(service.get_all_projects()) == before + 1
+        finally:
+            with engine.begin() as conn:
+                conn.execute(
+                    text("DELETE FROM projects WHERE name = 'Written elsewhere'")
+                )
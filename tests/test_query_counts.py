@@ -0,0 +1,76 @@
+"""
+Query-count regression tests.
+
+Each test seeds data, clears the recorded statements and asserts that a
+listing call issues a fixed number of queries, however many rows it
+returns (guards against N+1 lazy loads).
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from todolist_app.services.project_service import ProjectService
+from todolist_app.services.task_service import TaskService
+
+
+@pytest.fixture
+def project_with_tasks(db_session):
+    """Create a project holding five tasks, two of them overdue."""
+    project = ProjectService(db_session).create_project("Query counts")
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    TaskService(db_session).create_tasks(
+        project.id,
+        [
+            {
+                "title": f"Task {i}",
+                "description": "Seeded task",
+                "deadline": yesterday if i < 2 else None,
+            }
+            for i in range(5)
+        ],
+    )
+    # Start from an empty identity map, as a new request would
+    db_session.expunge_all()
+    return project
+
+
+class TestTaskQueryCounts:
+    """Task listings run a single SELECT each."""
+
+    def test_get_tasks_by_project(
+        self, db_session, project_with_tasks, query_counter
+    ):
+        service = TaskService(db_session)
+        query_counter.clear()
+
+        tasks = service.get_tasks_by_project(project_with_tasks.id)
+        # Listing fields are loaded up front, not per task
+        rows = [(t.id, t.title, t.status, t.deadline) for t in tasks]
+
+        assert len(rows) == 5
+        assert len(query_counter) == 1
+
+    def test_get_overdue_tasks(
+        self, db_session, project_with_tasks, query_counter
+    ):
+        service = TaskService(db_session)
+        query_counter.clear()
+
+        tasks = service.get_overdue_tasks(project_with_tasks.id)
+
+        assert len(tasks) == 2
+        assert len(query_counter) == 1
+
+    def test_get_task_counts(
+        self, db_session, project_with_tasks, query_counter
+    ):
+        other = ProjectService(db_session).create_project("Empty project")
+        service = TaskService(db_session)
+        query_counter.clear()
+
+        counts = service.get_task_counts([project_with_tasks.id, other.id])
+
+        assert counts[project_with_tasks.id] == 5
+        assert counts.get(other.id, 0) == 0
+        assert len(query_counter) == 1
@@ -0,0 +1,54 @@
+"""
+Tests that long-lived sessions see rows changed by other processes.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from todolist_app.db import session as session_module
+from todolist_app.models import Project
+from todolist_app.services.project_service import ProjectService
+from todolist_app.services.task_service import TaskService
+
+
+@pytest.fixture
+def app_sessions(engine, monkeypatch):
+    """The application's session factory, bound to the test database."""
+    monkeypatch.setattr(
+        session_module, "get_engine", lambda pool_pre_ping=None: engine
+    )
+    factory = session_module.get_sessionmaker.__wrapped__()
+
+    yield factory
+
+    with factory() as db:
+        db.execute(delete(Project).where(Project.name == "Expiry"))
+        db.commit()
+
+
+def test_cli_session_sees_task_closed_elsewhere(app_sessions):
+    with app_sessions() as cli_db:
+        project_id = ProjectService(cli_db).create_project("Expiry").id
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        task_service = TaskService(cli_db)
+        task_id = task_service.create_task(
+            project_id, "Overdue", "Closed by the scheduler", deadline=yesterday
+        ).id
+        # Still referenced, as the CLI's task list is, so it stays in the
+        # session's identity map
+        listed = task_service.get_tasks_by_project(project_id)
+        cli_db.commit()
+
+        # The scheduler closes overdue tasks from its own session
+        with app_sessions() as scheduler_db:
+            assert TaskService(scheduler_db).autoclose_overdue_tasks() >= 1
+
+        # The CLI ends its next action's transaction, then reads the task
+        cli_db.commit()
+        task = task_service.get_task_by_id(task_id)
+
+        assert task is listed[0]
+        assert task.status.value == "done"
+        assert task.closed_at is not None
@@ -0,0 +1,27 @@
+"""
+Tests for the in-memory TaskManager.
+"""
+
+import pytest
+
+from todolist_app.managers.task_manager import TaskManager
+from todolist_app.models.project import Project
+
+
+@pytest.fixture
+def manager():
+    TaskManager.reset_id_counter()
+    return TaskManager(Project(name="In memory", tasks=[]))
+
+
+class TestPendingTasks:
+    """Pending tasks are listed in creation order."""
+
+    def test_order_survives_status_changes(self, manager):
+        first = manager.create_task("First", "Created first")
+        second = manager.create_task("Second", "Started", status="doing")
+        third = manager.create_task("Third", "Created last")
+        done = manager.create_task("Done", "Finished", status="done")
+
+        assert manager.get_pending_tasks() == [first, second, third]
+        assert done not in manager.get_pending_tasks()
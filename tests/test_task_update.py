@@ -0,0 +1,58 @@
+"""
+Tests for moving tasks between projects with TaskService.update_task.
+"""
+
+import pytest
+
+from todolist_app.exceptions import (
+    MaxLimitException,
+    ProjectNotFoundException,
+)
+from todolist_app.services.project_service import ProjectService
+from todolist_app.services.task_service import TaskService
+from todolist_app.utils.config import Config
+
+
+@pytest.fixture
+def task_limit(monkeypatch):
+    """Lower the per-project task limit to two."""
+    monkeypatch.setattr(Config, "MAX_NUMBER_OF_TASK", 2)
+    return 2
+
+
+@pytest.fixture
+def services(db_session):
+    return ProjectService(db_session), TaskService(db_session)
+
+
+class TestMoveTask:
+    """A move respects the target project's limit and foreign key."""
+
+    def test_move_into_full_project_rejected(self, services, task_limit):
+        projects, tasks = services
+        full = projects.create_project("Full").id
+        other = projects.create_project("Other").id
+        for i in range(task_limit):
+            tasks.create_task(full, f"Task {i}", "Fills the project")
+        task = tasks.create_task(other, "Mover", "Wants to move")
+
+        with pytest.raises(MaxLimitException):
+            tasks.update_task(task.id, project_id=full)
+
+    def test_update_within_full_project_allowed(self, services, task_limit):
+        projects, tasks = services
+        full = projects.create_project("Full").id
+        task = tasks.create_task(full, "Stays", "Already here")
+        tasks.create_task(full, "Other", "Fills the project")
+
+        updated = tasks.update_task(task.id, title="Renamed", project_id=full)
+
+        assert updated.title == "Renamed"
+
+    def test_move_to_unknown_project_not_found(self, services):
+        projects, tasks = services
+        project_id = projects.create_project("Source").id
+        task = tasks.create_task(project_id, "Mover", "Target does not exist")
+
+        with pytest.raises(ProjectNotFoundException):
+            tasks.update_task(task.id, project_id=999_999)
@@ -8,16 +8,9 @@ sys.path.insert(0, str(BASE_DIR))
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 from alembic import context
-import os
-import sys
-from pathlib import Path
-
-# Add project root to sys.path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 # Load your SQLAlchemy Base + models
 from todolist_app.db.base import Base
-from todolist_app.db.base import Base
 from todolist_app.models.project import Project
 
 # Alembic Config
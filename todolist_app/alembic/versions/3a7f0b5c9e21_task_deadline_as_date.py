@@ -0,0 +1,38 @@
+"""store task deadline as date
+
+Revision ID: 3a7f0b5c9e21
+Revises: e1f6a9c2d8b4
+Create Date: 2026-10-15 11:34:12.880145
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7f0b5c9e21'
+down_revision: Union[str, None] = 'e1f6a9c2d8b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'tasks', 'deadline',
+        existing_type=sa.DateTime(),
+        type_=sa.Date(),
+        existing_nullable=True,
+        postgresql_using='deadline::date'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'tasks', 'deadline',
+        existing_type=sa.Date(),
+        type_=sa.DateTime(),
+        existing_nullable=True,
+        postgresql_using='deadline::timestamp'
+    )
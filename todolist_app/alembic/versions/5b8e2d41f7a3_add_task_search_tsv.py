@@ -0,0 +1,41 @@
+"""add task full-text search vector
+
+Revision ID: 5b8e2d41f7a3
+Revises: c22b9b6c18a2
+Create Date: 2026-10-15 09:12:40.118302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2d41f7a3'
+down_revision: Union[str, None] = 'c22b9b6c18a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column(
+        'search_tsv',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('english', "
+            "coalesce(title, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index(
+        'ix_tasks_search_tsv', 'tasks', ['search_tsv'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_search_tsv', table_name='tasks')
+    op.drop_column('tasks', 'search_tsv')
@@ -0,0 +1,36 @@
+"""add trigram indexes for project search
+
+Revision ID: 7c2e5a9d1f48
+Revises: 3a7f0b5c9e21
+Create Date: 2026-10-15 12:21:40.316207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5a9d1f48'
+down_revision: Union[str, None] = '3a7f0b5c9e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_projects_name_trgm', 'projects', ['name'],
+        unique=False, postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_projects_description_trgm', 'projects', ['description'],
+        unique=False, postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_description_trgm', table_name='projects')
+    op.drop_index('ix_projects_name_trgm', table_name='projects')
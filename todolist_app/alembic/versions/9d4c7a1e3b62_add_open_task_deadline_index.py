@@ -0,0 +1,29 @@
+"""add partial index on open task deadlines
+
+Revision ID: 9d4c7a1e3b62
+Revises: 5b8e2d41f7a3
+Create Date: 2026-10-15 09:48:03.527911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c7a1e3b62'
+down_revision: Union[str, None] = '5b8e2d41f7a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_deadline_open', 'tasks', ['deadline'],
+        unique=False, postgresql_where=sa.text("status != 'DONE'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_deadline_open', table_name='tasks')
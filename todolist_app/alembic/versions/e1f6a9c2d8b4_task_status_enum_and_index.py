@@ -0,0 +1,34 @@
+"""align taskstatus enum and index project/status lookups
+
+Revision ID: e1f6a9c2d8b4
+Revises: 9d4c7a1e3b62
+Create Date: 2026-10-15 10:21:57.604418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f6a9c2d8b4'
+down_revision: Union[str, None] = '9d4c7a1e3b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The initial migration created the native enum with IN_PROGRESS, but the
+    # model uses DOING; add it so status filters compare enum to enum.
+    # PostgreSQL before 12 rejects ADD VALUE inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE taskstatus ADD VALUE IF NOT EXISTS 'DOING'")
+    op.create_index(
+        'ix_tasks_project_id_status', 'tasks', ['project_id', 'status'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    # Postgres cannot drop a value from an enum type; only the index is removed.
+    op.drop_index('ix_tasks_project_id_status', table_name='tasks')
@@ -5,12 +5,17 @@ Provides database session management for API endpoints.
 
 from typing import Generator
 from sqlalchemy.orm import Session
-from todolist_app.db.session import SessionLocal
+from todolist_app.db.session import get_sessionmaker
 
 
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function that provides a database session to route handlers.
+
+    Each request gets its own session. FastAPI may run the setup, the
+    endpoint and the teardown of a sync dependency on different threadpool
+    workers, so a thread-keyed registry would share sessions between
+    concurrent requests.
     
     Yields:
         Session: SQLAlchemy database session
@@ -20,7 +25,10 @@ def get_db() -> Generator[Session, None, None]:
         def list_projects(db: Session = Depends(get_db)):
             ...
     """
-    db = SessionLocal()
+    # The session ends with the request, so nothing can go stale: keep the
+    # state loaded by UPDATE ... RETURNING usable after commit instead of
+    # re-SELECTing it when the response is serialized
+    db = get_sessionmaker()(expire_on_commit=False)
     try:
         yield db
     finally:
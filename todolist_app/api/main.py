@@ -11,14 +11,22 @@ from contextlib import asynccontextmanager
 import logging
 
 from todolist_app.api.routers import project_router, task_router
-from todolist_app.db.session import engine
+from todolist_app.db.session import get_engine
 from todolist_app.db.base import Base
-from todolist_app.exceptions.service_exceptions import TodoListException
+from todolist_app.exceptions import (
+    TodoListException,
+    ProjectNotFoundException,
+    TaskNotFoundException,
+    DuplicateProjectException,
+    DuplicateTaskException,
+    ValidationException,
+    MaxLimitException,
+)
 from todolist_app.utils.config import Config
 
 # Configure logging from Config
 logging.basicConfig(
-    level=getattr(logging, Config.get_log_level()),
+    level=getattr(logging, Config.LOG_LEVEL),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -27,23 +35,23 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager - initializes database on startup."""
-    logger.info(f"Starting {Config.get_app_name()} v{Config.get_api_version()}...")
-    logger.info(f"Environment: {Config.get_environment()}")
+    logger.info(f"Starting {Config.APP_NAME} v{Config.API_VERSION}...")
+    logger.info(f"Environment: {Config.APP_ENV}")
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         logger.info("✅ Database tables created/verified")
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
         raise
     yield
-    logger.info(f"Shutting down {Config.get_app_name()}...")
+    logger.info(f"Shutting down {Config.APP_NAME}...")
 
 
 # Create FastAPI app instance with Config-driven settings
 app = FastAPI(
-    title=Config.get_app_name(),
+    title=Config.APP_NAME,
     description=f"""
-## {Config.get_app_name()} - Management System API
+## {Config.APP_NAME} - Management System API
 
 A comprehensive RESTful API for managing projects and tasks.
 
@@ -56,9 +64,9 @@ A comprehensive RESTful API for managing projects and tasks.
 
 ### Environment
 
-- **Version**: {Config.get_api_version()}
-- **Environment**: {Config.get_environment()}
-- **Debug Mode**: {Config.is_debug_mode()}
+- **Version**: {Config.API_VERSION}
+- **Environment**: {Config.APP_ENV}
+- **Debug Mode**: {Config.DEBUG}
 
 ### Quick Start
 
@@ -77,14 +85,14 @@ A comprehensive RESTful API for managing projects and tasks.
 - Project name minimum: {Config.PROJECT_NAME_MIN_WORDS} words
 - Task description maximum: {Config.TASK_DESCRIPTION_MAX_WORDS} words
     """,
-    version=Config.get_api_version(),
-    debug=Config.is_debug_mode(),
+    version=Config.API_VERSION,
+    debug=Config.DEBUG,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
     contact={
-        "name": f"{Config.get_app_name()} Support",
+        "name": f"{Config.APP_NAME} Support",
         "email": "mr-ahmadi2004@outlook.com"
     },
     license_info={
@@ -132,7 +140,7 @@ def custom_openapi():
     # Use Config to generate server URLs dynamically
     base_url = Config.get_api_base_url()
     openapi_schema["servers"] = [
-        {"url": base_url, "description": f"{Config.get_environment()} Server"}
+        {"url": base_url, "description": f"{Config.APP_ENV} Server"}
     ]
     
     app.openapi_schema = openapi_schema
@@ -143,35 +151,46 @@ def custom_openapi():
 # CORS middleware with Config-driven origins
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=Config.get_cors_origins(),
+    allow_origins=Config.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
-# Global exception handler
-@app.exception_handler(TodoListException)
-async def todolist_exception_handler(request: Request, exc: TodoListException):
-    """Handle TodoListException globally with appropriate status codes."""
-    status_code = 400
-    error_msg = str(exc).lower()
-    
-    if "not found" in error_msg:
-        status_code = 404
-    elif "already exists" in error_msg:
-        status_code = 409
-    
-    logger.warning(f"TodoListException: {exc} (Status: {status_code})")
-    
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "error": exc.__class__.__name__,
-            "message": str(exc),
-            "status_code": status_code
-        }
-    )
+# HTTP status code per domain exception. Each class gets its own handler, so
+# Starlette resolves the status by type lookup and routers need no try/except.
+EXCEPTION_STATUS_CODES = {
+    ProjectNotFoundException: 404,
+    TaskNotFoundException: 404,
+    DuplicateProjectException: 409,
+    DuplicateTaskException: 409,
+    ValidationException: 400,
+    MaxLimitException: 400,
+    TodoListException: 400,  # Fallback for any other application error
+}
+
+
+def _make_exception_handler(status_code: int):
+    """Build an exception handler that answers with a fixed status code."""
+
+    async def handler(request: Request, exc: TodoListException):
+        logger.warning(f"{exc.__class__.__name__}: {exc} (Status: {status_code})")
+        return JSONResponse(
+            status_code=status_code,
+            content={
+                "error": exc.__class__.__name__,
+                "message": str(exc),
+                "status_code": status_code
+            }
+        )
+
+    return handler
+
+
+# Global exception handlers
+for exc_class, status_code in EXCEPTION_STATUS_CODES.items():
+    app.add_exception_handler(exc_class, _make_exception_handler(status_code))
 
 
 # Include routers with tags
@@ -195,10 +214,10 @@ def root():
     - Available endpoints
     """
     return {
-        "message": f"Welcome to {Config.get_app_name()}",
-        "version": Config.get_api_version(),
-        "environment": Config.get_environment(),
-        "debug": Config.is_debug_mode(),
+        "message": f"Welcome to {Config.APP_NAME}",
+        "version": Config.API_VERSION,
+        "environment": Config.APP_ENV,
+        "debug": Config.DEBUG,
         "docs": "/docs",
         "redoc": "/redoc",
         "endpoints": {
@@ -227,10 +246,10 @@ def health_check():
     """
     return {
         "status": "healthy",
-        "service": Config.get_app_name(),
-        "version": Config.get_api_version(),
-        "environment": Config.get_environment(),
-        "debug": Config.is_debug_mode()
+        "service": Config.APP_NAME,
+        "version": Config.API_VERSION,
+        "environment": Config.APP_ENV,
+        "debug": Config.DEBUG
     }
 
 
@@ -252,13 +271,13 @@ def api_info():
     - Configuration details
     """
     return {
-        "api": Config.get_app_name(),
-        "version": Config.get_api_version(),
-        "environment": Config.get_environment(),
-        "debug": Config.is_debug_mode(),
+        "api": Config.APP_NAME,
+        "version": Config.API_VERSION,
+        "environment": Config.APP_ENV,
+        "debug": Config.DEBUG,
         "server": {
-            "host": Config.get_api_host(),
-            "port": Config.get_api_port(),
+            "host": Config.API_HOST,
+            "port": Config.API_PORT,
             "base_url": Config.get_api_base_url()
         },
         "features": [
@@ -284,7 +303,7 @@ def api_info():
             "task_description_max_words": Config.TASK_DESCRIPTION_MAX_WORDS
         },
         "cors": {
-            "allowed_origins": Config.get_cors_origins()
+            "allowed_origins": Config.CORS_ORIGINS
         }
     }
 
@@ -310,21 +329,21 @@ def main():
     base_url = Config.get_api_base_url()
     
     logger.info("=" * 70)
-    logger.info(f"🚀 Starting {Config.get_app_name()} v{Config.get_api_version()}")
-    logger.info(f"📌 Environment: {Config.get_environment()}")
-    logger.info(f"🐛 Debug Mode: {Config.is_debug_mode()}")
+    logger.info(f"🚀 Starting {Config.APP_NAME} v{Config.API_VERSION}")
+    logger.info(f"📌 Environment: {Config.APP_ENV}")
+    logger.info(f"🐛 Debug Mode: {Config.DEBUG}")
     logger.info(f"🌐 Server: {base_url}")
     logger.info(f"📚 Docs: {base_url}/docs")
     logger.info(f"📊 ReDoc: {base_url}/redoc")
-    logger.info(f"🔍 Log Level: {Config.get_log_level()}")
+    logger.info(f"🔍 Log Level: {Config.LOG_LEVEL}")
     logger.info("=" * 70)
     
     uvicorn.run(
         "todolist_app.api.main:app",
-        host=Config.get_api_host(),
-        port=Config.get_api_port(),
-        reload=Config.is_debug_mode(),
-        log_level=Config.get_log_level().lower()
+        host=Config.API_HOST,
+        port=Config.API_PORT,
+        reload=Config.DEBUG,
+        log_level=Config.LOG_LEVEL.lower()
     )
 
 
@@ -2,7 +2,7 @@
 API route modules.
 """
 
-from .project_router import router as project_router
-from .task_router import router as task_router
+from todolist_app.api.routers.project_router import router as project_router
+from todolist_app.api.routers.task_router import router as task_router
 
 __all__ = ["project_router", "task_router"]
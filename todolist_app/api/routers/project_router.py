@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -7,10 +7,10 @@ from todolist_app.api.schemas.project_schemas import (
     ProjectCreate, 
     ProjectUpdate, 
     ProjectRead, 
-    ProjectInList
+    ProjectInList,
+    ProjectListAdapter
 )
 from todolist_app.services.project_service import ProjectService
-from todolist_app.exceptions import ProjectNotFoundException
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -31,41 +31,34 @@ def list_projects(db: Session = Depends(get_db)):
     """List all projects"""
     service = ProjectService(db)
     projects = service.get_all_projects()
-    return projects
+    # Serialize the whole list in one pydantic-core pass
+    payload = ProjectListAdapter.dump_json(
+        ProjectListAdapter.validate_python(projects, from_attributes=True)
+    )
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
 def get_project(project_id: int, db: Session = Depends(get_db)):
     """Get a specific project by ID"""
     service = ProjectService(db)
-    try:
-        project = service.get_project_by_id(project_id)
-        return project
-    except ProjectNotFoundException:
-        raise HTTPException(status_code=404, detail=f"Project with id {project_id} not found")
+    return service.get_project_by_id(project_id)
 
 
 @router.put("/{project_id}", response_model=ProjectRead)
 def update_project(project_id: int, project: ProjectUpdate, db: Session = Depends(get_db)):
     """Update a project"""
     service = ProjectService(db)
-    try:
-        updated = service.update_project(
-            project_id=project_id,
-            name=project.name,  # Changed from title to name
-            description=project.description
-        )
-        return updated
-    except ProjectNotFoundException:
-        raise HTTPException(status_code=404, detail=f"Project with id {project_id} not found")
+    return service.update_project(
+        project_id=project_id,
+        name=project.name,  # Changed from title to name
+        description=project.description
+    )
 
 
 @router.delete("/{project_id}", status_code=204)
 def delete_project(project_id: int, db: Session = Depends(get_db)):
     """Delete a project"""
     service = ProjectService(db)
-    try:
-        service.delete_project(project_id)
-        return None
-    except ProjectNotFoundException:
-        raise HTTPException(status_code=404, detail=f"Project with id {project_id} not found")
+    service.delete_project(project_id)
+    return None
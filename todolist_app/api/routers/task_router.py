@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from todolist_app.api.dependencies import get_db
@@ -11,11 +11,40 @@ from todolist_app.api.schemas.task_schemas import (
     TaskUpdate,
     TaskRead,
     TaskInList,
+    TaskListAdapter,
 )
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
+def _task_list_response(tasks) -> Response:
+    """
+    Serialize a list of tasks in one pydantic-core pass.
+
+    Returning a Response directly skips FastAPI's per-item response_model
+    validation; response_model is still used for the OpenAPI docs.
+    """
+    payload = TaskListAdapter.dump_json(
+        TaskListAdapter.validate_python(tasks, from_attributes=True)
+    )
+    return Response(content=payload, media_type="application/json")
+
+
+def _task_response(task, status_code: int = 200) -> Response:
+    """
+    Serialize a single ORM task without re-validating it.
+
+    The task is wrapped with TaskRead.from_orm_fast and dumped straight to
+    JSON; response_model is still used for the OpenAPI docs.
+    """
+    payload = TaskRead.from_orm_fast(task).model_dump_json()
+    return Response(
+        content=payload,
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 @router.post("/", response_model=TaskRead, status_code=201)
 def create_task(
     task_data: TaskCreate,
@@ -36,22 +65,17 @@ def create_task(
     if not task_data.project_id:
         raise HTTPException(status_code=400, detail="project_id is required")
     
-    project_service = ProjectService(db)
-    project = project_service.get_project_by_id(task_data.project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Raises ProjectNotFoundException (-> 404) if the project is missing
+    ProjectService(db).get_project_by_id(task_data.project_id)
     
-    try:
-        task = task_service.create_task(
-            project_id=task_data.project_id,
-            title=task_data.title,
-            description=task_data.description,
-            deadline=task_data.deadline,
-            status=task_data.status if task_data.status else "todo"
-        )
-        return task
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    task = task_service.create_task(
+        project_id=task_data.project_id,
+        title=task_data.title,
+        description=task_data.description,
+        deadline=task_data.deadline,
+        status=task_data.status if task_data.status else "todo"
+    )
+    return _task_response(task, status_code=201)
 
 
 @router.get("/", response_model=List[TaskInList])
@@ -68,30 +92,24 @@ def list_tasks(
     """
     task_service = TaskService(db)
     
-    try:
-        if project_id and status:
-            # Filter by both project and status
-            tasks = task_service.get_tasks_by_status(project_id, status)
-        elif project_id:
-            # Filter by project only
-            tasks = task_service.get_tasks_by_project(project_id)
-        elif status:
-            # Status filter without project not directly supported
-            # We'd need to get all tasks first - service doesn't have get_all_tasks()
-            raise HTTPException(
-                status_code=400, 
-                detail="Status filter requires project_id"
-            )
-        else:
-            # No filters - but service doesn't have get_all_tasks()
-            raise HTTPException(
-                status_code=400,
-                detail="Please provide project_id to list tasks"
-            )
-        
-        return tasks
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    if project_id:
+        # Summary columns only - no ORM instances for list views
+        tasks = task_service.get_task_summaries(project_id, status)
+    elif status:
+        # Status filter without project not directly supported
+        # We'd need to get all tasks first - service doesn't have get_all_tasks()
+        raise HTTPException(
+            status_code=400, 
+            detail="Status filter requires project_id"
+        )
+    else:
+        # No filters - but service doesn't have get_all_tasks()
+        raise HTTPException(
+            status_code=400,
+            detail="Please provide project_id to list tasks"
+        )
+    
+    return _task_list_response(tasks)
 
 
 @router.get("/overdue", response_model=List[TaskInList])
@@ -105,8 +123,8 @@ def list_overdue_tasks(
     - **project_id**: Filter by project (optional)
     """
     task_service = TaskService(db)
-    tasks = task_service.get_overdue_tasks(project_id)
-    return tasks
+    tasks = list(task_service.iter_overdue_tasks(project_id))
+    return _task_list_response(tasks)
 
 
 @router.get("/search", response_model=List[TaskInList])
@@ -123,7 +141,7 @@ def search_tasks(
     """
     task_service = TaskService(db)
     tasks = task_service.search_tasks(project_id, query)
-    return tasks
+    return _task_list_response(tasks)
 
 
 @router.get("/{task_id}", response_model=TaskRead)
@@ -137,12 +155,7 @@ def get_task(
     - **task_id**: ID of the task
     """
     task_service = TaskService(db)
-    
-    try:
-        task = task_service.get_task_by_id(task_id)
-        return task
-    except Exception as e:
-        raise HTTPException(status_code=404, detail="Task not found")
+    return _task_response(task_service.get_task_by_id(task_id))
 
 
 @router.put("/{task_id}", response_model=TaskRead)
@@ -155,39 +168,26 @@ def update_task(
     Update a task.
     
     All fields are optional - only provided fields will be updated.
+    The update is one UPDATE ... RETURNING statement: a missing task and
+    an unknown project_id (foreign key violation) both map to 404. A move
+    to a project already at the task limit is rejected with 400.
     
     - **title**: New task title
     - **description**: New description
     - **deadline**: New deadline in YYYY-MM-DD format
     - **status**: New status (todo, doing, done, overdue)
+    - **project_id**: Move the task to another project
     """
     task_service = TaskService(db)
-    
-    # Check if task exists
-    try:
-        task = task_service.get_task_by_id(task_id)
-    except Exception:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    # Validate project_id if being updated
-    if task_data.project_id:
-        project_service = ProjectService(db)
-        try:
-            project = project_service.get_project_by_id(task_data.project_id)
-        except Exception:
-            raise HTTPException(status_code=404, detail="Project not found")
-    
-    try:
-        updated_task = task_service.update_task(
-            task_id=task_id,
-            title=task_data.title,
-            description=task_data.description,
-            deadline=task_data.deadline,
-            status=task_data.status
-        )
-        return updated_task
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    task = task_service.update_task(
+        task_id=task_id,
+        title=task_data.title,
+        description=task_data.description,
+        deadline=task_data.deadline,
+        status=task_data.status,
+        project_id=task_data.project_id
+    )
+    return _task_response(task)
 
 
 @router.patch("/{task_id}/mark-done", response_model=TaskRead)
@@ -201,12 +201,7 @@ def mark_task_done(
     - **task_id**: ID of the task
     """
     task_service = TaskService(db)
-    
-    try:
-        task = task_service.mark_task_as_done(task_id)
-        return task
-    except Exception as e:
-        raise HTTPException(status_code=404, detail="Task not found")
+    return _task_response(task_service.mark_task_as_done(task_id))
 
 
 @router.delete("/{task_id}", status_code=204)
@@ -220,11 +215,5 @@ def delete_task(
     - **task_id**: ID of the task to delete
     """
     task_service = TaskService(db)
-    
-    try:
-        task_service.get_task_by_id(task_id)
-    except Exception:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
     task_service.delete_task(task_id)
     return None
@@ -1,18 +1,20 @@
-from .project_schemas import (
+from todolist_app.api.schemas.project_schemas import (
     ProjectBase,
     ProjectCreate,
     ProjectUpdate,
     ProjectRead,
     ProjectInList,
+    ProjectListAdapter,
     # Remove ProjectList from here - it's not in the schema file anymore
 )
 
-from .task_schemas import (
+from todolist_app.api.schemas.task_schemas import (
     TaskBase,
     TaskCreate,
     TaskUpdate,
     TaskRead,
     TaskInList,
+    TaskListAdapter,
 )
 
 __all__ = [
@@ -22,6 +24,7 @@ __all__ = [
     "ProjectUpdate",
     "ProjectRead",
     "ProjectInList",
+    "ProjectListAdapter",
     # Removed "ProjectList"
     
     # Task schemas
@@ -30,4 +33,5 @@ __all__ = [
     "TaskUpdate",
     "TaskRead",
     "TaskInList",
+    "TaskListAdapter",
 ]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -36,3 +36,7 @@ class ProjectInList(BaseModel):
     created_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
+
+
+# Pre-built adapter for list responses (one pydantic-core pass per list)
+ProjectListAdapter = TypeAdapter(List[ProjectInList])
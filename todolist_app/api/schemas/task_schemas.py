@@ -1,17 +1,40 @@
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict, field_validator, field_serializer
-from enum import Enum
+from datetime import date, datetime
+from typing import Annotated, List, Optional
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    PlainSerializer,
+    TypeAdapter,
+    model_validator,
+)
+
+# str-based Enum shared with the ORM model: pydantic-core validates and
+# serializes it natively, no Python field validator needed
+from todolist_app.models.task import TaskStatus
 
 
 # -----------------------------------------------------------
-# Status Enum (aligned with Validator)
+# Shared field serializers
 # -----------------------------------------------------------
-class TaskStatus(str, Enum):
-    """Task status enumeration"""
-    TODO = "todo"
-    DOING = "doing" 
-    DONE = "done"
+def _serialize_date_only(dt: datetime) -> str:
+    """Serialize a datetime to YYYY-MM-DD format"""
+    return dt.date().isoformat()
+
+
+def _serialize_to_minutes(dt: datetime) -> str:
+    """Serialize a datetime to YYYY-MM-DD HH:MM format"""
+    return dt.isoformat(sep=' ', timespec='minutes')
+
+
+# One serializer node per function, reused by every schema field below.
+# (deadline is a DATE column and needs no Python serializer.)
+DateOnly = Annotated[
+    datetime, PlainSerializer(_serialize_date_only, return_type=str)
+]
+DateTimeToMinutes = Annotated[
+    datetime, PlainSerializer(_serialize_to_minutes, return_type=str)
+]
 
 
 # -----------------------------------------------------------
@@ -21,47 +44,14 @@ class TaskBase(BaseModel):
     """Base schema for Task with common fields"""
     title: str = Field(..., min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
-    deadline: Optional[str] = Field(
+    # Parsed from YYYY-MM-DD natively by pydantic-core
+    deadline: Optional[date] = Field(
         None,
         description="Task deadline in YYYY-MM-DD format"
     )
-    status: str = Field(default="todo")
+    status: TaskStatus = Field(default=TaskStatus.TODO)
     project_id: Optional[int] = Field(None, gt=0)
 
-    @field_validator("deadline", mode="before")
-    @classmethod
-    def parse_deadline(cls, v):
-        """
-        Validate and parse deadline.
-        Accept: None, datetime object, or YYYY-MM-DD string
-        Return: YYYY-MM-DD string or None
-        """
-        if v is None:
-            return None
-        
-        # If it's already a datetime object, convert to string
-        if isinstance(v, datetime):
-            return v.strftime('%Y-%m-%d')
-        
-        # If it's a string, validate format
-        if isinstance(v, str):
-            try:
-                datetime.strptime(v, "%Y-%m-%d")
-                return v
-            except ValueError:
-                raise ValueError("deadline must be in YYYY-MM-DD format")
-        
-        raise ValueError("deadline must be a string or datetime object")
-    
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v):
-        """Validate status matches allowed values"""
-        allowed = ["todo", "doing", "done"]
-        if v not in allowed:
-            raise ValueError(f"Status must be one of: {', '.join(allowed)}")
-        return v
-
 
 # -----------------------------------------------------------
 # Create Schema
@@ -70,8 +60,8 @@ class TaskCreate(TaskBase):
     """Schema for creating a new task"""
     project_id: int = Field(..., gt=0)  # Required for creation
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Complete project documentation",
                 "description": "Write API documentation",
@@ -80,6 +70,7 @@ class TaskCreate(TaskBase):
                 "status": "todo"
             }
         }
+    )
 
 
 # -----------------------------------------------------------
@@ -89,54 +80,34 @@ class TaskUpdate(BaseModel):
     """Schema for updating a task - all fields optional"""
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
-    deadline: Optional[str] = Field(
+    deadline: Optional[date] = Field(
         None,
         description="Task deadline in YYYY-MM-DD format"
     )
-    status: Optional[str] = None
+    status: Optional[TaskStatus] = None
     project_id: Optional[int] = Field(None, gt=0)
-    
-    @field_validator("deadline", mode="before")
+
+    @model_validator(mode="before")
     @classmethod
-    def parse_deadline(cls, v):
+    def drop_none_fields(cls, data):
         """
-        Validate and parse deadline for update.
-        Accept: None, datetime object, or YYYY-MM-DD string
-        Return: YYYY-MM-DD string or None
+        Drop explicit nulls so pydantic-core skips those fields entirely.
+        They fall back to their None default and stay out of model_fields_set.
         """
-        if v is None:
-            return None
-        
-        if isinstance(v, datetime):
-            return v.strftime('%Y-%m-%d')
-        
-        if isinstance(v, str):
-            try:
-                datetime.strptime(v, "%Y-%m-%d")
-                return v
-            except ValueError:
-                raise ValueError("deadline must be in YYYY-MM-DD format")
-        
-        raise ValueError("deadline must be a string or datetime object")
-    
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v):
-        """Validate status if provided"""
-        if v is None:
-            return v
-        allowed = ["todo", "doing", "done"]
-        if v not in allowed:
-            raise ValueError(f"Status must be one of: {', '.join(allowed)}")
-        return v
+        if isinstance(data, dict):
+            return {k: v for k, v in data.items() if v is not None}
+        return data
     
-    class Config:
-        json_schema_extra = {
+    # Rarely used (PUT only): build the core schema on first use
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "title": "Updated task title",
                 "status": "doing"
             }
         }
+    )
 
 
 # -----------------------------------------------------------
@@ -147,28 +118,34 @@ class TaskRead(BaseModel):
     id: int
     title: str
     description: Optional[str] = None
-    deadline: Optional[datetime] = None
-    status: str
+    deadline: Optional[date] = None
+    status: TaskStatus
     project_id: int
-    created_at: datetime
-    updated_at: datetime
-    closed_at: Optional[datetime] = None
-
-    model_config = ConfigDict(from_attributes=True)
-
-    @field_serializer('deadline', 'closed_at', when_used='always')
-    def serialize_date_only(self, dt: Optional[datetime]) -> Optional[str]:
-        """Serialize deadline and closed_at to YYYY-MM-DD format"""
-        if dt is None:
-            return None
-        return dt.strftime('%Y-%m-%d')
-    
-    @field_serializer('created_at', 'updated_at', when_used='always')
-    def serialize_datetime(self, dt: Optional[datetime]) -> Optional[str]:
-        """Serialize created_at and updated_at to YYYY-MM-DD HH:MM format"""
-        if dt is None:
-            return None
-        return dt.strftime('%Y-%m-%d %H:%M')
+    created_at: DateTimeToMinutes
+    updated_at: DateTimeToMinutes
+    closed_at: Optional[DateOnly] = None
+
+    # Response-only: never mutated or re-validated after construction
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        revalidate_instances='never'
+    )
+
+    @classmethod
+    def from_orm_fast(cls, obj) -> "TaskRead":
+        """
+        Build a TaskRead from an ORM Task without running validation.
+
+        Safe because database values are already typed; reads the field
+        names from the precomputed _READ_FIELDS tuple.
+        """
+        data = {name: getattr(obj, name) for name in _READ_FIELDS}
+        return cls.model_construct(**data)
+
+
+# Field names read from ORM objects by TaskRead.from_orm_fast
+_READ_FIELDS = tuple(TaskRead.model_fields)
 
 
 # -----------------------------------------------------------
@@ -178,15 +155,20 @@ class TaskInList(BaseModel):
     """Schema for task in list responses"""
     id: int
     title: str
-    status: str
-    deadline: Optional[datetime] = None
+    status: TaskStatus
+    deadline: Optional[date] = None
     project_id: int
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        revalidate_instances='never'
+    )
 
-    @field_serializer('deadline', when_used='always')
-    def serialize_deadline(self, dt: Optional[datetime]) -> Optional[str]:
-        """Serialize deadline to YYYY-MM-DD format"""
-        if dt is None:
-            return None
-        return dt.strftime('%Y-%m-%d')
+
+# -----------------------------------------------------------
+# Pre-built adapters for list responses
+# -----------------------------------------------------------
+# Validating/dumping a whole list through one adapter runs in a single
+# pydantic-core call instead of one model_validate per item.
+TaskListAdapter = TypeAdapter(List[TaskInList])
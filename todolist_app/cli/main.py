@@ -5,14 +5,119 @@ This module provides the command-line interface for interacting with
 the ToDoList application using database persistence.
 """
 
-from typing import Optional
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
+from todolist_app.exceptions.repository_exceptions import (
+    ProjectNotFoundException,
+)
 from todolist_app.exceptions.service_exceptions import TodoListException
-from todolist_app.services.project_service import ProjectService
-from todolist_app.services.task_service import TaskService
-from todolist_app.models.task import TaskStatus
-from todolist_app.utils.config import Config
-from todolist_app.db.session import get_db_context
+
+if TYPE_CHECKING:
+    from todolist_app.models.task import Task
+
+
+@cache
+def _get_config():
+    """
+    Import Config on first use.
+
+    Loading Config reads the .env file and environment, so it is deferred
+    until a handler needs a limit instead of happening at module import.
+
+    Returns:
+        type[Config]: The application Config class
+    """
+    from todolist_app.utils.config import Config
+
+    return Config
+
+
+@cache
+def _valid_statuses_str() -> str:
+    """
+    Join the valid statuses once for the prompts.
+
+    Returns:
+        str: Comma-separated valid status values
+    """
+    return ", ".join(_get_config().VALID_STATUSES)
+
+
+def _banner(title: str) -> None:
+    """
+    Write a handler's title banner in a single stdout write.
+
+    Args:
+        title (str): Banner title (centered between separator lines)
+    """
+    sys.stdout.write(f"\n{SEP}\n{title.center(60)}\n{SEP}\n")
+
+
+_readline = sys.stdin.readline
+_STDIN_IS_TTY = sys.stdin.isatty()
+
+
+def _prompt(message: str, editable: bool = False) -> str:
+    """
+    Prompt for a line without going through input()'s readline setup.
+
+    input() is only used for ``editable`` prompts on an interactive
+    terminal, where line editing helps; menu choices and piped or
+    scripted input always take the plain stdin path.
+
+    Args:
+        message (str): Prompt text
+        editable (bool): Whether the prompt is free-text data entry
+
+    Returns:
+        str: Entered line without its trailing newline
+
+    Raises:
+        EOFError: If stdin is closed (same as input())
+    """
+    if editable and _STDIN_IS_TTY:
+        return input(message)
+
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = _readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+# Streamed search results are written to stdout this many rows at a time
+SEARCH_OUTPUT_BATCH: int = 100
+
+# ========== Static Menu Text ==========
+SEP: str = "=" * 60
+DIVIDER: str = "-" * 60
+
+MAIN_MENU_HEADER: str = "\n".join(["\n" + SEP, "MAIN MENU".center(60), SEP])
+
+MAIN_MENU_BODY: str = "\n".join([
+    DIVIDER,
+    "\nProject Management:",
+    "  1. Create Project",
+    "  2. View All Projects",
+    "  3. Select Project",
+    "  4. Edit Project",
+    "  5. Delete Project",
+    "\nTask Management:",
+    "  6. Create Task",
+    "  7. View All Tasks",
+    "  8. View Tasks by Status",
+    "  9. Edit Task",
+    "  10. Delete Task",
+    "  11. Mark Task as Done",
+    "\nSearch:",
+    "  12. Search Projects",
+    "  13. Search Tasks",
+    "\n  0. Exit",
+    SEP,
+])
 
 
 class TodoListCLI:
@@ -24,11 +129,44 @@ class TodoListCLI:
 
     Attributes:
         current_project_id (Optional[int]): ID of currently selected project
+        db (Session): Database session shared by all menu actions
+        project_service (ProjectService): Project service bound to db
+        task_service (TaskService): Task service bound to db
+        _header_cache (Dict[int, Tuple[str, int]]): (name, task count) of
+            projects already rendered in the menu header, keyed by project ID
+        _dispatch (Dict[str, Callable[[], None]]): Menu choice to handler
     """
 
     def __init__(self):
-        """Initialize the CLI."""
+        """Initialize the CLI with one session and service pair for the run."""
+        # Imported here so module import (entry-point resolution, quick
+        # exits) does not pay for loading SQLAlchemy and the ORM models
+        from todolist_app.db.session import get_sessionmaker
+        from todolist_app.services.project_service import ProjectService
+        from todolist_app.services.task_service import TaskService
+
         self.current_project_id: Optional[int] = None
+        self.db = get_sessionmaker()()
+        self.project_service = ProjectService(self.db)
+        self.task_service = TaskService(self.db)
+        self._header_cache: Dict[int, Tuple[str, int]] = {}
+
+        # Menu choice -> handler, built once instead of an if/elif chain
+        self._dispatch: Dict[str, Callable[[], None]] = {
+            "1": self._create_project,
+            "2": self._view_all_projects,
+            "3": self._select_project,
+            "4": self._edit_project,
+            "5": self._delete_project,
+            "6": self._create_task,
+            "7": self._view_all_tasks,
+            "8": self._view_tasks_by_status,
+            "9": self._edit_task,
+            "10": self._delete_task,
+            "11": self._mark_task_as_done,
+            "12": self._search_projects,
+            "13": self._search_tasks,
+        }
 
     def run(self) -> None:
         """
@@ -36,325 +174,371 @@ class TodoListCLI:
 
         Displays the main menu and handles user input until exit.
         """
-        print("=" * 60)
+        print(SEP)
         print("Welcome to ToDoList Application (Deprecated)".center(60))
-        print("=" * 60)
+        print(SEP)
         print()
 
-        while True:
-            self._display_main_menu()
-            choice = input("\nEnter your choice: ").strip()
+        try:
+            while True:
+                self._display_main_menu()
+                choice = _prompt("\nEnter your choice: ").strip()
+
+                # Nothing to act on or read: redraw the menu without pausing
+                if not choice:
+                    continue
+
+                try:
+                    if choice == "0":
+                        print("\nThank you for using ToDoList Application!")
+                        print("Goodbye! 👋")
+                        break
+
+                    handler = self._dispatch.get(choice)
+                    if handler is not None:
+                        handler()
+                    else:
+                        print("\n❌ Invalid choice. Please try again.")
+
+                    # End the action's transaction; the session is reused
+                    self.db.commit()
+
+                except TodoListException as e:
+                    self.db.rollback()
+                    print(f"\n❌ Error: {str(e)}")
+                except KeyboardInterrupt:
+                    self.db.rollback()
+                    print("\n\nOperation cancelled by user.")
+                except Exception as e:
+                    self.db.rollback()
+                    print(f"\n❌ Unexpected error: {str(e)}")
+
+                # The transaction is already finished here, so no connection
+                # is held while waiting for the user
+                _prompt("\nPress Enter to continue...")
+        finally:
+            self.db.close()
+
+    @staticmethod
+    def _parse_choice(choice: str) -> Optional[int]:
+        """
+        Parse a menu selection (list number or ID) entered by the user.
 
-            try:
-                if choice == "1":
-                    self._create_project()
-                elif choice == "2":
-                    self._view_all_projects()
-                elif choice == "3":
-                    self._select_project()
-                elif choice == "4":
-                    self._edit_project()
-                elif choice == "5":
-                    self._delete_project()
-                elif choice == "6":
-                    self._create_task()
-                elif choice == "7":
-                    self._view_all_tasks()
-                elif choice == "8":
-                    self._view_tasks_by_status()
-                elif choice == "9":
-                    self._edit_task()
-                elif choice == "10":
-                    self._delete_task()
-                elif choice == "11":
-                    self._mark_task_as_done()
-                elif choice == "12":
-                    self._search_projects()
-                elif choice == "13":
-                    self._search_tasks()
-                elif choice == "0":
-                    print("\nThank you for using ToDoList Application!")
-                    print("Goodbye! 👋")
-                    break
-                else:
-                    print("\n❌ Invalid choice. Please try again.")
-
-            except TodoListException as e:
-                print(f"\n❌ Error: {str(e)}")
-            except KeyboardInterrupt:
-                print("\n\nOperation cancelled by user.")
-            except Exception as e:
-                print(f"\n❌ Unexpected error: {str(e)}")
-
-            input("\nPress Enter to continue...")
+        Args:
+            choice (str): Raw user input
+
+        Returns:
+            Optional[int]: Parsed number, or None if input is not an integer
+        """
+        try:
+            return int(choice)
+        except ValueError:
+            return None
+
+    def _tasks_changed(self) -> None:
+        """Drop cached views that include the current project's tasks."""
+        self._header_cache.pop(self.current_project_id, None)
+        self.project_service.invalidate()
+
+    @staticmethod
+    def _find_loaded(items: List, item_id: int) -> Optional[object]:
+        """
+        Find a project or task by ID in a list that was already fetched.
+
+        Args:
+            items (List): Projects or tasks shown to the user
+            item_id (int): ID entered by the user
+
+        Returns:
+            Optional[object]: Matching item, or None if it is not loaded
+        """
+        return next((item for item in items if item.id == item_id), None)
 
     def _display_main_menu(self) -> None:
-        """Display the main menu options."""
-        print("\n" + "=" * 60)
-        print("MAIN MENU".center(60))
-        print("=" * 60)
+        """Display the main menu options in a single stdout write."""
+        project_line = "📁 No project selected"
 
         # Display current project info
         if self.current_project_id:
             try:
-                with get_db_context() as db:
-                    service = ProjectService(db)
-                    project = service.get_project_by_id(self.current_project_id)
-                    task_count = TaskService(db).get_task_count(project.id)
-                    print(f"📁 Current Project: {project.name} (ID: {project.id})")
-                    print(f"   Tasks: {task_count}")
-            except Exception:
+                header = self._header_cache.get(self.current_project_id)
+                if header is None:
+                    project = self.project_service.get_project_by_id(
+                        self.current_project_id
+                    )
+                    header = (
+                        project.name,
+                        self.task_service.get_task_count(project.id),
+                    )
+                    self._header_cache[self.current_project_id] = header
+                name, task_count = header
+                project_line = (
+                    f"📁 Current Project: {name} (ID: {self.current_project_id})\n"
+                    f"   Tasks: {task_count}"
+                )
+            except ProjectNotFoundException:
+                # Deleted elsewhere since it was selected
                 self.current_project_id = None
-                print("📁 No project selected")
-        else:
-            print("📁 No project selected")
-
-        print("-" * 60)
-        print("\nProject Management:")
-        print("  1. Create Project")
-        print("  2. View All Projects")
-        print("  3. Select Project")
-        print("  4. Edit Project")
-        print("  5. Delete Project")
-
-        print("\nTask Management:")
-        print("  6. Create Task")
-        print("  7. View All Tasks")
-        print("  8. View Tasks by Status")
-        print("  9. Edit Task")
-        print("  10. Delete Task")
-        print("  11. Mark Task as Done")
-
-        print("\nSearch:")
-        print("  12. Search Projects")
-        print("  13. Search Tasks")
-
-        print("\n  0. Exit")
-        print("=" * 60)
+            finally:
+                # End the header read's transaction, so no connection sits
+                # idle in transaction at the menu prompt and a failed query
+                # cannot abort the user's next action
+                self.db.rollback()
+
+        sys.stdout.write(
+            f"{MAIN_MENU_HEADER}\n{project_line}\n{MAIN_MENU_BODY}\n"
+        )
 
     def _create_project(self) -> None:
         """Handle project creation."""
-        print("\n" + "=" * 60)
-        print("CREATE NEW PROJECT".center(60))
-        print("=" * 60)
+        config = _get_config()
+        _banner("CREATE NEW PROJECT")
 
-        name = input(
-            f"\nProject Name ({Config.PROJECT_NAME_MIN_WORDS}-"
-            f"{Config.PROJECT_NAME_MAX_WORDS} words): "
+        name = _prompt(
+            f"\nProject Name ({config.PROJECT_NAME_MIN_WORDS}-"
+            f"{config.PROJECT_NAME_MAX_WORDS} words): ",
+            editable=True,
         ).strip()
-        description = input(
-            f"Description (optional, max {Config.PROJECT_DESCRIPTION_MAX_WORDS} words): "
+        description = _prompt(
+            f"Description (optional, max {config.PROJECT_DESCRIPTION_MAX_WORDS} words): ",
+            editable=True,
         ).strip()
 
-        with get_db_context() as db:
-            service = ProjectService(db)
-            project = service.create_project(
-                name, description if description else None
-            )
-            print(f"\n✅ Project created successfully!")
-            print(f"   ID: {project.id}")
-            print(f"   Name: {project.name}")
+        service = self.project_service
+        project = service.create_project(
+            name, description if description else None
+        )
+        print(f"\n✅ Project created successfully!")
+        print(f"   ID: {project.id}")
+        print(f"   Name: {project.name}")
 
     def _view_all_projects(self) -> None:
         """Display all projects."""
-        print("\n" + "=" * 60)
-        print("ALL PROJECTS".center(60))
-        print("=" * 60)
+        _banner("ALL PROJECTS")
 
-        with get_db_context() as db:
-            service = ProjectService(db)
-            projects = service.get_all_projects()
+        # Plain rows: nothing here needs ORM objects
+        projects = self.project_service.get_project_summaries()
 
-            if not projects:
-                print("\n📭 No projects found.")
-                return
+        if not projects:
+            print("\n📭 No projects found.")
+            return
 
-            for i, project in enumerate(projects, 1):
-                task_count = TaskService(db).get_task_count(project.id)
-                print(f"\n{i}. Project ID: {project.id}")
-                print(f"   Name: {project.name}")
-                print(f"   Description: {project.description}")
-                print(f"   Tasks: {task_count}")
-                print(f"   Created: {project.created_at.strftime('%Y-%m-%d %H:%M')}")
+        lines: List[str] = []
+        for i, project in enumerate(projects, 1):
+            lines.append(
+                f"\n{i}. Project ID: {project.id}\n"
+                f"   Name: {project.name}\n"
+                f"   Description: {project.description}\n"
+                f"   Tasks: {project.task_count}\n"
+                f"   Created: {project.created_at.strftime('%Y-%m-%d %H:%M')}"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _select_project(self) -> None:
         """Handle project selection."""
-        print("\n" + "=" * 60)
-        print("SELECT PROJECT".center(60))
-        print("=" * 60)
-
-        with get_db_context() as db:
-            service = ProjectService(db)
-            projects = service.get_all_projects()
+        _banner("SELECT PROJECT")
 
-            if not projects:
-                print("\n📭 No projects available. Create a project first.")
-                return
+        service = self.project_service
+        # Rows with a task_count column: one GROUP BY, no task rows loaded
+        projects = service.get_project_summaries()
 
-            # Display projects
-            for i, project in enumerate(projects, 1):
-                task_count = TaskService(db).get_task_count(project.id)
-                print(f"{i}. {project.name} (ID: {project.id}) - {task_count} tasks")
+        if not projects:
+            print("\n📭 No projects available. Create a project first.")
+            return
 
-            choice = input("\nEnter project number or ID: ").strip()
+        # Display projects
+        lines: List[str] = []
+        for i, project in enumerate(projects, 1):
+            lines.append(
+                f"{i}. {project.name} (ID: {project.id}) - "
+                f"{project.task_count} tasks"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        choice = _prompt("\nEnter project number or ID: ").strip()
+
+        try:
+            # Try as index first
+            number = self._parse_choice(choice)
+            if number is None:
+                raise ValueError(f"'{choice}' is not a valid number or ID.")
+
+            if 1 <= number <= len(projects):
+                selected_project = projects[number - 1]
+                self.current_project_id = selected_project.id
+            else:
+                # Try as ID (already loaded projects need no query)
+                project = self._find_loaded(projects, number) or (
+                    service.get_project_by_id(number)
+                )
+                self.current_project_id = project.id
 
-            try:
-                # Try as index first
-                if choice.isdigit() and 1 <= int(choice) <= len(projects):
-                    selected_project = projects[int(choice) - 1]
-                    self.current_project_id = selected_project.id
-                else:
-                    # Try as ID
-                    project_id = int(choice)
-                    project = service.get_project_by_id(project_id)
-                    self.current_project_id = project.id
-
-                print(f"\n✅ Project selected!")
-            except (ValueError, TodoListException):
-                print("\n❌ Invalid selection.")
+            print(f"\n✅ Project selected!")
+        except (ValueError, TodoListException):
+            print("\n❌ Invalid selection.")
 
     def _edit_project(self) -> None:
         """Handle project editing."""
-        print("\n" + "=" * 60)
-        print("EDIT PROJECT".center(60))
-        print("=" * 60)
+        config = _get_config()
+        _banner("EDIT PROJECT")
 
-        with get_db_context() as db:
-            service = ProjectService(db)
-            projects = service.get_all_projects()
+        service = self.project_service
+        projects = service.get_all_projects()
 
-            if not projects:
-                print("\n📭 No projects available.")
-                return
+        if not projects:
+            print("\n📭 No projects available.")
+            return
 
-            # Display projects
-            for i, project in enumerate(projects, 1):
-                print(f"{i}. {project.name} (ID: {project.id})")
+        # Display projects
+        lines: List[str] = []
+        for i, project in enumerate(projects, 1):
+            lines.append(f"{i}. {project.name} (ID: {project.id})")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        choice = _prompt("\nEnter project number or ID to edit: ").strip()
+
+        try:
+            # Get project
+            number = self._parse_choice(choice)
+            if number is None:
+                raise ValueError(f"'{choice}' is not a valid number or ID.")
+
+            if 1 <= number <= len(projects):
+                project = projects[number - 1]
+            else:
+                project = self._find_loaded(projects, number) or (
+                    service.get_project_by_id(number)
+                )
 
-            choice = input("\nEnter project number or ID to edit: ").strip()
+            print(f"\nCurrent Name: {project.name}")
+            print(f"Current Description: {project.description}")
 
-            try:
-                # Get project
-                if choice.isdigit() and 1 <= int(choice) <= len(projects):
-                    project = projects[int(choice) - 1]
-                else:
-                    project_id = int(choice)
-                    project = service.get_project_by_id(project_id)
-
-                print(f"\nCurrent Name: {project.name}")
-                print(f"Current Description: {project.description}")
-
-                name = input("\nNew Name (or press Enter to keep current): ").strip()
-                description = input(
-                    f"New Description (optional, max "
-                    f"{Config.PROJECT_DESCRIPTION_MAX_WORDS} words, "
-                    f"or press Enter to keep current): "
-                ).strip()
-
-                # Update project
-                service.update_project(
-                    project.id,
-                    name=name if name else None,
-                    description=description if description else None,
-                )
+            name = _prompt(
+                "\nNew Name (or press Enter to keep current): ", editable=True
+            ).strip()
+            description = _prompt(
+                f"New Description (optional, max "
+                f"{config.PROJECT_DESCRIPTION_MAX_WORDS} words, "
+                f"or press Enter to keep current): ",
+                editable=True,
+            ).strip()
 
-                print("\n✅ Project updated successfully!")
+            # Update project
+            service.update_project(
+                project.id,
+                name=name if name else None,
+                description=description if description else None,
+            )
+            self._header_cache.pop(project.id, None)
+
+            print("\n✅ Project updated successfully!")
 
-            except (ValueError, TodoListException) as e:
-                print(f"\n❌ Error: {str(e)}")
+        except (ValueError, TodoListException) as e:
+            print(f"\n❌ Error: {str(e)}")
 
     def _delete_project(self) -> None:
         """Handle project deletion."""
-        print("\n" + "=" * 60)
-        print("DELETE PROJECT".center(60))
-        print("=" * 60)
+        _banner("DELETE PROJECT")
 
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            task_service = TaskService(db)
-            projects = proj_service.get_all_projects()
+        proj_service = self.project_service
+        # Rows with a task_count column: one GROUP BY, no task rows loaded
+        projects = proj_service.get_project_summaries()
 
-            if not projects:
-                print("\n📭 No projects available.")
-                return
+        if not projects:
+            print("\n📭 No projects available.")
+            return
 
-            # Display projects
-            for i, project in enumerate(projects, 1):
-                task_count = task_service.get_task_count(project.id)
-                print(f"{i}. {project.name} (ID: {project.id}) - {task_count} tasks")
+        # Display projects
+        lines: List[str] = []
+        for i, project in enumerate(projects, 1):
+            lines.append(
+                f"{i}. {project.name} (ID: {project.id}) - "
+                f"{project.task_count} tasks"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
-            choice = input("\nEnter project number or ID to delete: ").strip()
+        choice = _prompt("\nEnter project number or ID to delete: ").strip()
 
-            try:
-                # Get project
-                if choice.isdigit() and 1 <= int(choice) <= len(projects):
-                    project = projects[int(choice) - 1]
-                else:
-                    project_id = int(choice)
-                    project = proj_service.get_project_by_id(project_id)
+        try:
+            # Get project
+            number = self._parse_choice(choice)
+            if number is None:
+                raise ValueError(f"'{choice}' is not a valid number or ID.")
 
-                task_count = task_service.get_task_count(project.id)
+            if 1 <= number <= len(projects):
+                project = projects[number - 1]
+            else:
+                project = self._find_loaded(projects, number)
 
-                # Confirm deletion
-                print(f"\n⚠️  WARNING: This will delete the project '{project.name}'")
-                print(f"   and all its {task_count} tasks permanently!")
-                confirm = input("\nType 'DELETE' to confirm: ").strip()
+            if project is not None:
+                task_count = project.task_count
+            else:
+                # Not in the list just shown (e.g. created meanwhile)
+                project = proj_service.get_project_by_id(number)
+                task_count = len(project.tasks)
 
-                if confirm == "DELETE":
-                    proj_service.delete_project(project.id)
+            # Confirm deletion
+            print(f"\n⚠️  WARNING: This will delete the project '{project.name}'")
+            print(f"   and all its {task_count} tasks permanently!")
+            confirm = _prompt("\nType 'DELETE' to confirm: ").strip()
 
-                    # Clear current project if deleted
-                    if self.current_project_id == project.id:
-                        self.current_project_id = None
+            if confirm == "DELETE":
+                proj_service.delete_project(project.id)
+                self._header_cache.pop(project.id, None)
 
-                    print("\n✅ Project deleted successfully!")
-                else:
-                    print("\n❌ Deletion cancelled.")
+                # Clear current project if deleted
+                if self.current_project_id == project.id:
+                    self.current_project_id = None
 
-            except (ValueError, TodoListException) as e:
-                print(f"\n❌ Error: {str(e)}")
+                print("\n✅ Project deleted successfully!")
+            else:
+                print("\n❌ Deletion cancelled.")
+
+        except (ValueError, TodoListException) as e:
+            print(f"\n❌ Error: {str(e)}")
 
     def _create_task(self) -> None:
         """Handle task creation."""
+        config = _get_config()
         if not self.current_project_id:
             print("\n❌ Please select a project first.")
             return
 
-        print("\n" + "=" * 60)
-        print("CREATE NEW TASK".center(60))
-        print("=" * 60)
-
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            project = proj_service.get_project_by_id(self.current_project_id)
-            print(f"Project: {project.name}\n")
+        _banner("CREATE NEW TASK")
 
-            title = input(
-                f"Task Title ({Config.TASK_TITLE_MIN_WORDS}-"
-                f"{Config.TASK_TITLE_MAX_WORDS} words): "
-            ).strip()
-            description = input(
-                f"Description ({Config.TASK_DESCRIPTION_MIN_WORDS}-"
-                f"{Config.TASK_DESCRIPTION_MAX_WORDS} words): "
-            ).strip()
-            deadline = input("Deadline (YYYY-MM-DD) or leave blank: ").strip()
-
-            print(f"\nValid statuses: {', '.join(Config.get_valid_statuses())}")
-            status = input("Status (default: todo): ").strip() or "todo"
+        proj_service = self.project_service
+        project = proj_service.get_project_by_id(self.current_project_id)
+        print(f"Project: {project.name}\n")
 
-            task_service = TaskService(db)
-            task = task_service.create_task(
-                project_id=self.current_project_id,
-                title=title,
-                description=description,
-                deadline=deadline if deadline else None,
-                status=status,
-            )
-
-            print(f"\n✅ Task created successfully!")
-            print(f"   ID: {task.id}")
-            print(f"   Title: {task.title}")
-            print(f"   Status: {task.status.value}")
+        title = _prompt(
+            f"Task Title ({config.TASK_TITLE_MIN_WORDS}-"
+            f"{config.TASK_TITLE_MAX_WORDS} words): ",
+            editable=True,
+        ).strip()
+        description = _prompt(
+            f"Description ({config.TASK_DESCRIPTION_MIN_WORDS}-"
+            f"{config.TASK_DESCRIPTION_MAX_WORDS} words): ",
+            editable=True,
+        ).strip()
+        deadline = _prompt("Deadline (YYYY-MM-DD) or leave blank: ").strip()
+
+        print(f"\nValid statuses: {_valid_statuses_str()}")
+        status = _prompt("Status (default: todo): ").strip() or "todo"
+
+        task_service = self.task_service
+        task = task_service.create_task(
+            project_id=self.current_project_id,
+            title=title,
+            description=description,
+            deadline=deadline if deadline else None,
+            status=status,
+        )
+        self._tasks_changed()
+
+        print(f"\n✅ Task created successfully!")
+        print(f"   ID: {task.id}")
+        print(f"   Title: {task.title}")
+        print(f"   Status: {task.status.value}")
 
     def _view_all_tasks(self) -> None:
         """Display all tasks in the current project."""
@@ -362,34 +546,33 @@ class TodoListCLI:
             print("\n❌ Please select a project first.")
             return
 
-        print("\n" + "=" * 60)
-        print("ALL TASKS".center(60))
-        print("=" * 60)
-
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            task_service = TaskService(db)
+        _banner("ALL TASKS")
 
-            project = proj_service.get_project_by_id(self.current_project_id)
-            print(f"Project: {project.name}\n")
+        project = self.project_service.get_project_by_id(self.current_project_id)
+        print(f"Project: {project.name}\n")
 
-            tasks = task_service.get_tasks_by_project(self.current_project_id)
+        # Plain rows: nothing here needs ORM objects
+        tasks = self.task_service.get_task_rows(self.current_project_id)
 
-            if not tasks:
-                print("📭 No tasks found in this project.")
-                return
+        if not tasks:
+            print("📭 No tasks found in this project.")
+            return
 
-            for i, task in enumerate(tasks, 1):
-                deadline_str = (
-                    task.deadline.strftime("%Y-%m-%d")
-                    if task.deadline
-                    else "No deadline"
-                )
-                print(f"\n{i}. Task ID: {task.id}")
-                print(f"   Title: {task.title}")
-                print(f"   Description: {task.description}")
-                print(f"   Status: {task.status.value}")
-                print(f"   Deadline: {deadline_str}")
+        lines: List[str] = []
+        for i, task in enumerate(tasks, 1):
+            deadline_str = (
+                task.deadline.strftime("%Y-%m-%d")
+                if task.deadline
+                else "No deadline"
+            )
+            lines.append(
+                f"\n{i}. Task ID: {task.id}\n"
+                f"   Title: {task.title}\n"
+                f"   Description: {task.description}\n"
+                f"   Status: {task.status.value}\n"
+                f"   Deadline: {deadline_str}"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _view_tasks_by_status(self) -> None:
         """Display tasks filtered by status."""
@@ -397,36 +580,114 @@ class TodoListCLI:
             print("\n❌ Please select a project first.")
             return
 
-        print("\n" + "=" * 60)
-        print("VIEW TASKS BY STATUS".center(60))
-        print("=" * 60)
+        _banner("VIEW TASKS BY STATUS")
 
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            task_service = TaskService(db)
+        proj_service = self.project_service
+        task_service = self.task_service
 
-            project = proj_service.get_project_by_id(self.current_project_id)
-            print(f"Project: {project.name}\n")
+        project = proj_service.get_project_by_id(self.current_project_id)
+        print(f"Project: {project.name}\n")
 
-            print(f"Valid statuses: {', '.join(Config.get_valid_statuses())}")
-            status = input("\nEnter status: ").strip().lower()
+        status_counts = task_service.get_status_counts(self.current_project_id)
+        print(
+            "Tasks per status: "
+            + ", ".join(f"{name}: {count}" for name, count in status_counts.items())
+        )
 
-            tasks = task_service.get_tasks_by_status(self.current_project_id, status)
+        print(f"Valid statuses: {_valid_statuses_str()}")
+        status = _prompt("\nEnter status: ").strip().lower()
 
-            if not tasks:
-                print(f"\n📭 No tasks with status '{status}' found.")
-                return
+        # Known-empty buckets need no query; unknown statuses still go
+        # through the service so they are rejected by validation
+        if status_counts.get(status) == 0:
+            tasks = []
+        else:
+            tasks = task_service.get_tasks_by_status(
+                self.current_project_id, status
+            )
 
-            print(f"\nTasks with status '{status}':")
-            for i, task in enumerate(tasks, 1):
-                deadline_str = (
-                    task.deadline.strftime("%Y-%m-%d")
-                    if task.deadline
-                    else "No deadline"
-                )
-                print(f"\n{i}. Task ID: {task.id}")
-                print(f"   Title: {task.title}")
-                print(f"   Deadline: {deadline_str}")
+        if not tasks:
+            print(f"\n📭 No tasks with status '{status}' found.")
+            return
+
+        print(f"\nTasks with status '{status}':")
+        lines: List[str] = []
+        for i, task in enumerate(tasks, 1):
+            deadline_str = (
+                task.deadline.strftime("%Y-%m-%d")
+                if task.deadline
+                else "No deadline"
+            )
+            lines.append(
+                f"\n{i}. Task ID: {task.id}\n"
+                f"   Title: {task.title}\n"
+                f"   Deadline: {deadline_str}"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _choose_task(
+        self,
+        action: str,
+        load_tasks: Callable[[], List["Task"]],
+        empty_message: str,
+        show_status: bool = False,
+    ) -> Optional["Task"]:
+        """
+        List the tasks and let the user pick one.
+
+        The choice is a list number or a task ID. A leading ``#`` marks
+        it as an ID, which also reaches tasks that are not in the list.
+
+        Args:
+            action (str): Verb used in the prompts (e.g. "edit")
+            load_tasks (Callable[[], List[Task]]): Fetches the tasks to list
+            empty_message (str): Message printed when there is nothing to list
+            show_status (bool): Whether to show each task's status in the list
+
+        Returns:
+            Optional[Task]: Chosen task, or None if there were no tasks
+
+        Raises:
+            ValueError: If the input is not a valid number or ID
+            TaskNotFoundException: If no task has the given ID
+        """
+        tasks = load_tasks()
+
+        if not tasks:
+            print(empty_message)
+            return None
+
+        # Display tasks
+        lines: List[str] = []
+        for i, task in enumerate(tasks, 1):
+            line = f"{i}. {task.title} (ID: {task.id})"
+            if show_status:
+                line += f" - Status: {task.status.value}"
+            lines.append(line)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        choice = _prompt(
+            f"\nEnter task number, or #ID, to {action}: "
+        ).strip()
+
+        if choice.startswith("#"):
+            task_id = self._parse_choice(choice[1:])
+            if task_id is None:
+                raise ValueError(f"'{choice}' is not a valid task ID.")
+            return self._find_loaded(tasks, task_id) or (
+                self.task_service.get_task_by_id(task_id)
+            )
+
+        number = self._parse_choice(choice)
+        if number is None:
+            raise ValueError(f"'{choice}' is not a valid number or ID.")
+
+        if 1 <= number <= len(tasks):
+            return tasks[number - 1]
+
+        return self._find_loaded(tasks, number) or (
+            self.task_service.get_task_by_id(number)
+        )
 
     def _edit_task(self) -> None:
         """Handle task editing."""
@@ -434,69 +695,60 @@ class TodoListCLI:
             print("\n❌ Please select a project first.")
             return
 
-        print("\n" + "=" * 60)
-        print("EDIT TASK".center(60))
-        print("=" * 60)
-
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            task_service = TaskService(db)
+        _banner("EDIT TASK")
 
-            project = proj_service.get_project_by_id(self.current_project_id)
-            print(f"Project: {project.name}\n")
+        task_service = self.task_service
 
-            tasks = task_service.get_tasks_by_project(self.current_project_id)
+        project = self.project_service.get_project_by_id(self.current_project_id)
+        print(f"Project: {project.name}\n")
 
-            if not tasks:
-                print("📭 No tasks available.")
+        try:
+            # Get task
+            task = self._choose_task(
+                "edit",
+                lambda: task_service.get_tasks_by_project(self.current_project_id),
+                "📭 No tasks available.",
+                show_status=True,
+            )
+            if task is None:
                 return
 
-            # Display tasks
-            for i, task in enumerate(tasks, 1):
-                print(f"{i}. {task.title} (ID: {task.id}) - Status: {task.status.value}")
+            print(f"\nCurrent Title: {task.title}")
+            print(f"Current Description: {task.description}")
+            print(f"Current Status: {task.status.value}")
+            print(
+                f"Current Deadline: "
+                f"{task.deadline.strftime('%Y-%m-%d') if task.deadline else 'None'}"
+            )
 
-            choice = input("\nEnter task number or ID to edit: ").strip()
+            title = _prompt(
+                "\nNew Title (or press Enter to keep current): ", editable=True
+            ).strip()
+            description = _prompt(
+                "New Description (or press Enter to keep current): ",
+                editable=True,
+            ).strip()
+            deadline = _prompt(
+                "New Deadline (YYYY-MM-DD) or press Enter to keep current: "
+            ).strip()
 
-            try:
-                # Get task
-                if choice.isdigit() and 1 <= int(choice) <= len(tasks):
-                    task = tasks[int(choice) - 1]
-                else:
-                    task_id = int(choice)
-                    task = task_service.get_task_by_id(task_id)
-
-                print(f"\nCurrent Title: {task.title}")
-                print(f"Current Description: {task.description}")
-                print(f"Current Status: {task.status.value}")
-                print(
-                    f"Current Deadline: "
-                    f"{task.deadline.strftime('%Y-%m-%d') if task.deadline else 'None'}"
-                )
+            print(f"\nValid statuses: {_valid_statuses_str()}")
+            status = _prompt("New Status (or press Enter to keep current): ").strip()
 
-                title = input("\nNew Title (or press Enter to keep current): ").strip()
-                description = input(
-                    "New Description (or press Enter to keep current): "
-                ).strip()
-                deadline = input(
-                    "New Deadline (YYYY-MM-DD) or press Enter to keep current: "
-                ).strip()
-
-                print(f"\nValid statuses: {', '.join(Config.get_valid_statuses())}")
-                status = input("New Status (or press Enter to keep current): ").strip()
-
-                # Update task
-                task_service.update_task(
-                    task.id,
-                    title=title if title else None,
-                    description=description if description else None,
-                    deadline=deadline if deadline else None,
-                    status=status if status else None,
-                )
+            # Update task
+            task_service.update_task(
+                task.id,
+                title=title if title else None,
+                description=description if description else None,
+                deadline=deadline if deadline else None,
+                status=status if status else None,
+            )
+            self._tasks_changed()
 
-                print("\n✅ Task updated successfully!")
+            print("\n✅ Task updated successfully!")
 
-            except (ValueError, TodoListException) as e:
-                print(f"\n❌ Error: {str(e)}")
+        except (ValueError, TodoListException) as e:
+            print(f"\n❌ Error: {str(e)}")
 
     def _delete_task(self) -> None:
         """Handle task deletion."""
@@ -504,50 +756,37 @@ class TodoListCLI:
             print("\n❌ Please select a project first.")
             return
 
-        print("\n" + "=" * 60)
-        print("DELETE TASK".center(60))
-        print("=" * 60)
+        _banner("DELETE TASK")
 
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            task_service = TaskService(db)
+        task_service = self.task_service
 
-            project = proj_service.get_project_by_id(self.current_project_id)
-            print(f"Project: {project.name}\n")
+        project = self.project_service.get_project_by_id(self.current_project_id)
+        print(f"Project: {project.name}\n")
 
-            tasks = task_service.get_tasks_by_project(self.current_project_id)
-
-            if not tasks:
-                print("📭 No tasks available.")
+        try:
+            # Get task
+            task = self._choose_task(
+                "delete",
+                lambda: task_service.get_tasks_by_project(self.current_project_id),
+                "📭 No tasks available.",
+            )
+            if task is None:
                 return
 
-            # Display tasks
-            for i, task in enumerate(tasks, 1):
-                print(f"{i}. {task.title} (ID: {task.id})")
+            # Confirm deletion
+            confirm = _prompt(
+                f"\nAre you sure you want to delete '{task.title}'? (yes/no): "
+            ).strip().lower()
 
-            choice = input("\nEnter task number or ID to delete: ").strip()
+            if confirm == "yes":
+                task_service.delete_task(task.id)
+                self._tasks_changed()
+                print("\n✅ Task deleted successfully!")
+            else:
+                print("\n❌ Deletion cancelled.")
 
-            try:
-                # Get task
-                if choice.isdigit() and 1 <= int(choice) <= len(tasks):
-                    task = tasks[int(choice) - 1]
-                else:
-                    task_id = int(choice)
-                    task = task_service.get_task_by_id(task_id)
-
-                # Confirm deletion
-                confirm = input(
-                    f"\nAre you sure you want to delete '{task.title}'? (yes/no): "
-                ).strip().lower()
-
-                if confirm == "yes":
-                    task_service.delete_task(task.id)
-                    print("\n✅ Task deleted successfully!")
-                else:
-                    print("\n❌ Deletion cancelled.")
-
-            except (ValueError, TodoListException) as e:
-                print(f"\n❌ Error: {str(e)}")
+        except (ValueError, TodoListException) as e:
+            print(f"\n❌ Error: {str(e)}")
 
     def _mark_task_as_done(self) -> None:
         """Handle marking a task as done."""
@@ -555,72 +794,60 @@ class TodoListCLI:
             print("\n❌ Please select a project first.")
             return
 
-        print("\n" + "=" * 60)
-        print("MARK TASK AS DONE".center(60))
-        print("=" * 60)
-
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            task_service = TaskService(db)
+        _banner("MARK TASK AS DONE")
 
-            project = proj_service.get_project_by_id(self.current_project_id)
-            print(f"Project: {project.name}\n")
+        task_service = self.task_service
 
-            # Get all tasks and filter pending ones
-            all_tasks = task_service.get_tasks_by_project(self.current_project_id)
-            pending_tasks = [t for t in all_tasks if t.status != TaskStatus.DONE]
+        project = self.project_service.get_project_by_id(self.current_project_id)
+        print(f"Project: {project.name}\n")
 
-            if not pending_tasks:
-                print("📭 No pending tasks to complete.")
+        try:
+            # Get task (only pending ones are listed)
+            task = self._choose_task(
+                "mark as done",
+                lambda: task_service.get_pending_tasks(self.current_project_id),
+                "📭 No pending tasks to complete.",
+                show_status=True,
+            )
+            if task is None:
                 return
 
-            # Display pending tasks
-            for i, task in enumerate(pending_tasks, 1):
-                print(f"{i}. {task.title} (ID: {task.id}) - Status: {task.status.value}")
-
-            choice = input("\nEnter task number or ID to mark as done: ").strip()
-
-            try:
-                # Get task
-                if choice.isdigit() and 1 <= int(choice) <= len(pending_tasks):
-                    task = pending_tasks[int(choice) - 1]
-                else:
-                    task_id = int(choice)
-                    task = task_service.get_task_by_id(task_id)
-
-                task_service.mark_task_as_done(task.id)
-                print(f"\n✅ Task '{task.title}' marked as done!")
+            task_service.mark_task_as_done(task.id)
+            self._tasks_changed()
+            print(f"\n✅ Task '{task.title}' marked as done!")
 
-            except (ValueError, TodoListException) as e:
-                print(f"\n❌ Error: {str(e)}")
+        except (ValueError, TodoListException) as e:
+            print(f"\n❌ Error: {str(e)}")
 
     def _search_projects(self) -> None:
         """Search projects by name or description."""
-        print("\n" + "=" * 60)
-        print("SEARCH PROJECTS".center(60))
-        print("=" * 60)
+        _banner("SEARCH PROJECTS")
 
-        query = input("\nEnter search term: ").strip()
+        query = _prompt("\nEnter search term: ", editable=True).strip()
 
         if not query:
             print("\n❌ Search term cannot be empty.")
             return
 
-        with get_db_context() as db:
-            service = ProjectService(db)
-            projects = service.search_projects(query)
+        service = self.project_service
+        projects = service.search_projects(query)
 
-            if not projects:
-                print(f"\n📭 No projects found matching '{query}'.")
-                return
+        if not projects:
+            print(f"\n📭 No projects found matching '{query}'.")
+            return
 
-            print(f"\nFound {len(projects)} project(s):")
-            for i, project in enumerate(projects, 1):
-                task_count = TaskService(db).get_task_count(project.id)
-                print(f"\n{i}. Project ID: {project.id}")
-                print(f"   Name: {project.name}")
-                print(f"   Description: {project.description}")
-                print(f"   Tasks: {task_count}")
+        print(f"\nFound {len(projects)} project(s):")
+        task_counts = self.task_service.get_task_counts(p.id for p in projects)
+        lines: List[str] = []
+        for i, project in enumerate(projects, 1):
+            task_count = task_counts.get(project.id, 0)
+            lines.append(
+                f"\n{i}. Project ID: {project.id}\n"
+                f"   Name: {project.name}\n"
+                f"   Description: {project.description}\n"
+                f"   Tasks: {task_count}"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _search_tasks(self) -> None:
         """Search tasks in current project."""
@@ -628,34 +855,47 @@ class TodoListCLI:
             print("\n❌ Please select a project first.")
             return
 
-        print("\n" + "=" * 60)
-        print("SEARCH TASKS".center(60))
-        print("=" * 60)
+        _banner("SEARCH TASKS")
 
-        with get_db_context() as db:
-            proj_service = ProjectService(db)
-            task_service = TaskService(db)
+        proj_service = self.project_service
+        task_service = self.task_service
 
-            project = proj_service.get_project_by_id(self.current_project_id)
-            print(f"Project: {project.name}\n")
+        project = proj_service.get_project_by_id(self.current_project_id)
+        print(f"Project: {project.name}\n")
 
-            query = input("Enter search term: ").strip()
+        query = _prompt("Enter search term: ", editable=True).strip()
 
-            if not query:
-                print("\n❌ Search term cannot be empty.")
-                return
+        if not query:
+            print("\n❌ Search term cannot be empty.")
+            return
 
-            tasks = task_service.search_tasks(self.current_project_id, query)
+        # Rows are streamed and written in batches, so large result sets
+        # start printing before the whole result is fetched
+        found = 0
+        lines: List[str] = []
+        for i, task in enumerate(
+            task_service.search_tasks_iter(self.current_project_id, query), 1
+        ):
+            if i == 1:
+                print("\nMatching tasks:")
+            found = i
+            lines.append(
+                f"\n{i}. Task ID: {task.id}\n"
+                f"   Title: {task.title}\n"
+                f"   Status: {task.status.value}"
+            )
+            if len(lines) == SEARCH_OUTPUT_BATCH:
+                sys.stdout.write("\n".join(lines) + "\n")
+                lines.clear()
 
-            if not tasks:
-                print(f"\n📭 No tasks found matching '{query}'.")
-                return
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+        if not found:
+            print(f"\n📭 No tasks found matching '{query}'.")
+            return
 
-            print(f"\nFound {len(tasks)} task(s):")
-            for i, task in enumerate(tasks, 1):
-                print(f"\n{i}. Task ID: {task.id}")
-                print(f"   Title: {task.title}")
-                print(f"   Status: {task.status.value}")
+        print(f"\nFound {found} task(s).")
 
 
 def main():
@@ -5,6 +5,10 @@ Exports database components for use throughout the application.
 """
 
 from todolist_app.db.base import Base
-from todolist_app.db.session import engine, SessionLocal, get_db
+from todolist_app.db.session import (
+    get_engine,
+    get_sessionmaker,
+    get_db,
+)
 
-__all__ = ['Base', 'engine', 'SessionLocal', 'get_db']
+__all__ = ['Base', 'get_engine', 'get_sessionmaker', 'get_db']
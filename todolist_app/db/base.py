@@ -4,6 +4,13 @@ Database base configuration module.
 This module defines the base class for all ORM models.
 """
 
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """
+    Declarative base class for all ORM models.
+
+    Uses the SQLAlchemy 2.0 typed declarative API, so models declare
+    columns as ``Mapped[...]`` attributes with ``mapped_column()``.
+    """
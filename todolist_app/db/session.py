@@ -2,32 +2,79 @@
 Database session management module.
 
 This module handles database connections and session management.
+
+SQL statement logging is off by default; set SQL_ECHO=1 (or true/yes)
+to have the engine echo every statement while debugging.
 """
 
+from functools import cache
+from typing import Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
 
-from todolist_app.utils.config import Config
 
-# Get database URL from Config
-DATABASE_URL = Config.get_database_url(sync=True)
+def get_engine(pool_pre_ping: Optional[bool] = None) -> Engine:
+    """
+    Get the application's SQLAlchemy engine, creating it on first use.
+
+    Config (and with it the .env file) is loaded here rather than at
+    import time, so importing the models or this module is cheap for
+    code paths that never open a connection.
+
+    Args:
+        pool_pre_ping (Optional[bool]): Validate pooled connections on
+            checkout; defaults to Config.DB_POOL_PRE_PING
+
+    Returns:
+        Engine: SQLAlchemy engine shared by callers with the same setting
+    """
+    if pool_pre_ping is None:
+        from todolist_app.utils.config import Config
+
+        pool_pre_ping = Config.DB_POOL_PRE_PING
+    return _create_engine(pool_pre_ping)
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,  # Set to True for debugging SQL queries
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_size=5,  # Number of connections to maintain
-    max_overflow=10  # Max connections beyond pool_size
-)
 
-# Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+@cache
+def _create_engine(pool_pre_ping: bool) -> Engine:
+    """Create the engine for one pre-ping setting (see get_engine)."""
+    from todolist_app.utils.config import Config
+
+    return create_engine(
+        Config.get_database_url(sync=True),
+        echo=Config.SQL_ECHO,  # SQL_ECHO=1 to log every statement
+        # Replace connections before the server/network drops them; the
+        # per-checkout SELECT 1 is opt-in for long-running processes
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=pool_pre_ping,
+        pool_size=Config.DB_POOL_SIZE,  # Connections kept open
+        max_overflow=Config.DB_MAX_OVERFLOW,  # Extra connections under load
+        pool_timeout=Config.DB_POOL_TIMEOUT,  # Seconds to wait for a free one
+    )
+
+
+@cache
+def get_sessionmaker(pool_pre_ping: Optional[bool] = None) -> sessionmaker:
+    """
+    Get the session factory bound to the shared engine.
+
+    Sessions expire their objects on commit, so long-lived sessions (the
+    CLI keeps one per process) reload rows changed by other processes.
+    Short-lived API sessions opt out per session (see api.dependencies).
+
+    Args:
+        pool_pre_ping (Optional[bool]): Passed to get_engine
+
+    Returns:
+        sessionmaker: Session factory
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(pool_pre_ping)
+    )
 
 
 def get_db() -> Session:
@@ -45,30 +92,38 @@ def get_db() -> Session:
         >>> finally:
         >>>     db.close()
     """
-    return SessionLocal()
+    return get_sessionmaker()()
 
 
 @contextmanager
-def get_db_context():
+def get_db_context(pool_pre_ping: Optional[bool] = None):
     """
     Context manager for database sessions.
     
-    Automatically commits on success and rolls back on error.
-    Always closes the session when done.
+    Commits on success if the session holds pending ORM changes and
+    rolls back on error. Always closes the session when done.
+
+    Read-only uses skip the COMMIT round-trip. Statements run directly
+    with ``db.execute()`` (e.g. bulk UPDATEs) are not tracked as pending
+    changes, so they must be committed explicitly, as the repositories do.
     
+    Args:
+        pool_pre_ping (Optional[bool]): Passed to get_engine
+
     Yields:
         Session: SQLAlchemy database session
         
     Example:
         >>> with get_db_context() as db:
         >>>     # Use db session here
-        >>>     # Automatically commits if no exception
+        >>>     # Automatically commits pending changes if no exception
         >>>     pass
     """
-    db = SessionLocal()
+    db = get_sessionmaker(pool_pre_ping)()
     try:
         yield db
-        db.commit()
+        if db.new or db.dirty or db.deleted:
+            db.commit()
     except Exception:
         db.rollback()
         raise
@@ -1,5 +1,5 @@
 """Project manager for handling project operations."""
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from todolist_app.models.project import Project
 from todolist_app.exceptions.custom_exceptions import (
     ValidationException,
@@ -18,7 +18,27 @@ class ProjectManager:
     
     def __init__(self):
         """Initialize project manager."""
-        self.projects: List[Project] = []
+        self._max_projects: int = Config.MAX_NUMBER_OF_PROJECT
+        # Projects by ID, in creation order; deleting is a single dict pop
+        self._by_id: Dict[int, Project] = {}
+        self._by_name: Dict[str, Project] = {}
+        # Lowercased (name, description) per project ID so searches do not
+        # re-lower every stored string on every query
+        self._search_text: Dict[int, Tuple[str, str]] = {}
+        # Immutable snapshot shared by readers until the next add/delete
+        self._snapshot: Optional[Tuple[Project, ...]] = None
+
+    @property
+    def projects(self) -> Sequence[Project]:
+        """
+        All projects in creation order.
+
+        Returns:
+            Sequence[Project]: Read-only view of the managed projects
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._by_id.values())
+        return self._snapshot
 
     @classmethod
     def _get_next_id(cls) -> int:
@@ -37,6 +57,10 @@ class ProjectManager:
         """Reset the project ID counter (useful for testing)."""
         cls._next_id = 1
 
+    def refresh_limits(self) -> None:
+        """Re-read the project limit from Config after a runtime change."""
+        self._max_projects = Config.MAX_NUMBER_OF_PROJECT
+
     def _is_duplicate_name(self, name: str, exclude_id: Optional[int] = None) -> bool:
         """
         Check if project name already exists.
@@ -48,12 +72,10 @@ class ProjectManager:
         Returns:
             bool: True if name exists, False otherwise
         """
-        for project in self.projects:
-            if exclude_id and project.id == exclude_id:
-                continue
-            if project.name.lower() == name.lower():
-                return True
-        return False
+        project = self._by_name.get(name.lower())
+        if project is None:
+            return False
+        return not (exclude_id and project.id == exclude_id)
 
     def create_project(
         self, name: str, description: Optional[str] = None
@@ -74,8 +96,8 @@ class ProjectManager:
             MaxLimitException: If project limit is exceeded
         """
         # Check project limit
-        max_projects = Config.get_max_projects()
-        if len(self.projects) >= max_projects:
+        max_projects = self._max_projects
+        if len(self._by_id) >= max_projects:
             raise MaxLimitException(
                 f"Cannot create project. Maximum {max_projects} projects allowed."
             )
@@ -97,9 +119,71 @@ class ProjectManager:
             description=description or "",  # ✅ Default to empty string
         )
 
-        self.projects.append(project)
+        self._snapshot = None
+        self._by_id[project.id] = project
+        self._by_name[name.lower()] = project
+        self._search_text[project.id] = (
+            name.lower(),
+            project.description.lower(),
+        )
         return project
 
+    def bulk_load(
+        self, items: List[Tuple[str, Optional[str]]]
+    ) -> List[Project]:
+        """
+        Create many projects at once, e.g. when restoring from storage.
+
+        All items are validated before any project is added, so a failure
+        leaves the manager unchanged.
+
+        Args:
+            items (List[Tuple[str, Optional[str]]]): (name, description) pairs
+
+        Returns:
+            List[Project]: Created projects, in input order
+
+        Raises:
+            ValidationException: If validation fails
+            DuplicateProjectException: If a name already exists or repeats
+            MaxLimitException: If project limit would be exceeded
+        """
+        max_projects = self._max_projects
+        if len(self._by_id) + len(items) > max_projects:
+            raise MaxLimitException(
+                f"Cannot create project. Maximum {max_projects} projects allowed."
+            )
+
+        seen = set(self._by_name)
+        for name, description in items:
+            Validator.validate_project_name(name)
+            Validator.validate_project_description(description or "")
+            name_lower = name.lower()
+            if name_lower in seen:
+                raise DuplicateProjectException(
+                    f"Project with name '{name}' already exists."
+                )
+            seen.add(name_lower)
+
+        created = [
+            Project(
+                id=self._get_next_id(),
+                name=name,
+                description=description or "",
+            )
+            for name, description in items
+        ]
+
+        self._snapshot = None
+        for project in created:
+            self._by_id[project.id] = project
+            self._by_name[project.name.lower()] = project
+            self._search_text[project.id] = (
+                project.name.lower(),
+                project.description.lower(),
+            )
+        return created
+
     def get_project_by_id(self, project_id: int) -> Project:
         """
         Get project by ID.
@@ -113,10 +197,10 @@ class ProjectManager:
         Raises:
             ProjectNotFoundException: If project is not found
         """
-        for project in self.projects:
-            if project.id == project_id:
-                return project
-        
+        project = self._by_id.get(project_id)
+        if project is not None:
+            return project
+
         raise ProjectNotFoundException(f"Project with ID {project_id} not found.")
 
     def update_project(
@@ -150,6 +234,8 @@ class ProjectManager:
                 raise DuplicateProjectException(
                     f"Project with name '{name}' already exists."
                 )
+            del self._by_name[project.name.lower()]
+            self._by_name[name.lower()] = project
             project.name = name
 
         # Validate and update description if provided
@@ -157,6 +243,12 @@ class ProjectManager:
             Validator.validate_project_description(description)
             project.description = description
 
+        if name is not None or description is not None:
+            self._search_text[project_id] = (
+                project.name.lower(),
+                (project.description or "").lower(),
+            )
+
         return project
 
     def delete_project(self, project_id: int) -> bool:
@@ -173,17 +265,21 @@ class ProjectManager:
             ProjectNotFoundException: If project is not found
         """
         project = self.get_project_by_id(project_id)
-        self.projects.remove(project)
+        self._snapshot = None
+        del self._by_id[project_id]
+        del self._by_name[project.name.lower()]
+        del self._search_text[project_id]
         return True
 
-    def get_all_projects(self) -> List[Project]:
+    def get_all_projects(self) -> Sequence[Project]:
         """
         Get all projects sorted by creation date.
 
         Returns:
-            List[Project]: List of all projects
+            Sequence[Project]: Read-only sequence of all projects
         """
-        return sorted(self.projects, key=lambda p: p.created_at)
+        # Dict insertion order is creation order, so no sort is needed
+        return self.projects
 
     def search_projects(self, query: str) -> List[Project]:
         """
@@ -197,8 +293,8 @@ class ProjectManager:
         """
         query_lower = query.lower()
         return [
-            project
-            for project in self.projects
-            if query_lower in project.name.lower()
-            or query_lower in project.description.lower()
+            self._by_id[project_id]
+            for project_id, (name_lower, description_lower)
+            in self._search_text.items()
+            if query_lower in name_lower or query_lower in description_lower
         ]
\ No newline at end of file
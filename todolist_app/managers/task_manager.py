@@ -5,13 +5,16 @@ This module provides the TaskManager class which handles all
 business logic related to task operations within a project.
 """
 
-from datetime import datetime
-from typing import List, Optional
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import DefaultDict, Dict, List, Optional, Sequence, Tuple
 
 from todolist_app.exceptions.custom_exceptions import (
     MaxLimitException,
     TaskNotFoundException,
 )
+from todolist_app.exceptions.service_exceptions import InvalidStatusException
 from todolist_app.models.project import Project
 from todolist_app.models.task import Task
 from todolist_app.utils.config import Config
@@ -27,6 +30,13 @@ class TaskManager:
 
     Attributes:
         project (Project): The project this manager is associated with
+        _by_id (Dict[int, Task]): Tasks of the project indexed by ID
+        _by_status (DefaultDict[str, Dict[int, Task]]): Tasks bucketed by
+            status, keyed by ID to keep insertion order
+        _search_text (Dict[int, Tuple[str, str]]): Lowercased title and
+            description per task ID, used by search
+        _by_deadline (List[Tuple[datetime, int]]): Sorted (deadline, task ID)
+            pairs for tasks that have a deadline
         _next_id (int): Class-level counter for generating unique task IDs
     """
 
@@ -40,6 +50,112 @@ class TaskManager:
             project (Project): The project to manage tasks for
         """
         self.project = project
+        self._max_tasks: int = Config.MAX_NUMBER_OF_TASK
+        self._by_id: Dict[int, Task] = {}
+        self._by_status: DefaultDict[str, Dict[int, Task]] = defaultdict(dict)
+        self._search_text: Dict[int, Tuple[str, str]] = {}
+        self._by_deadline: List[Tuple[datetime, int]] = []
+        # Immutable snapshot shared by readers until the next add/delete
+        self._snapshot: Optional[Tuple[Task, ...]] = None
+        for task in project.tasks:
+            self._index(task)
+
+    def refresh_limits(self) -> None:
+        """Re-read the task limit from Config after a runtime change."""
+        self._max_tasks = Config.MAX_NUMBER_OF_TASK
+
+    @staticmethod
+    def _deadline_key(deadline: date) -> datetime:
+        """
+        Normalize a deadline to a datetime so date and datetime sort together.
+
+        Args:
+            deadline (date): Deadline as loaded (date) or parsed (datetime)
+
+        Returns:
+            datetime: The deadline as a datetime
+        """
+        if isinstance(deadline, datetime):
+            return deadline
+        return datetime.combine(deadline, time.min)
+
+    def _index_deadline(self, task: Task) -> None:
+        """
+        Insert a task into the sorted deadline index if it has a deadline.
+
+        Args:
+            task (Task): Task to index
+        """
+        if task.deadline:
+            insort(self._by_deadline, (self._deadline_key(task.deadline), task.id))
+
+    def _unindex_deadline(self, task: Task) -> None:
+        """
+        Remove a task from the sorted deadline index if it has a deadline.
+
+        Args:
+            task (Task): Task to remove
+        """
+        if task.deadline:
+            entry = (self._deadline_key(task.deadline), task.id)
+            del self._by_deadline[bisect_left(self._by_deadline, entry)]
+
+    def _index(self, task: Task) -> None:
+        """
+        Add a task to the ID and status indices.
+
+        Args:
+            task (Task): Task to index
+        """
+        self._snapshot = None
+        self._by_id[task.id] = task
+        self._by_status[task.status][task.id] = task
+        self._search_text[task.id] = (
+            task.title.lower(),
+            (task.description or "").lower(),
+        )
+        self._index_deadline(task)
+
+    def _apply_update(
+        self,
+        task: Task,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[date] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        Apply already-validated changes to a task and keep indices in sync.
+
+        Only fields that are not None are changed. The status bucket and
+        search text are updated in the same step, so no rescan is needed.
+
+        Args:
+            task (Task): Task to update
+            title (Optional[str]): New title
+            description (Optional[str]): New description
+            deadline (Optional[date]): New parsed deadline
+            status (Optional[str]): New status
+        """
+        if title is not None:
+            task.title = title
+        if description is not None:
+            task.description = description
+        if deadline is not None:
+            self._unindex_deadline(task)
+            task.deadline = deadline
+            self._index_deadline(task)
+        if status is not None and status != task.status:
+            self._by_status[task.status].pop(task.id, None)
+            self._by_status[status][task.id] = task
+            task.status = status
+        task.updated_at = datetime.now()
+
+        if title is not None or description is not None:
+            self._search_text[task.id] = (
+                task.title.lower(),
+                (task.description or "").lower(),
+            )
 
     @classmethod
     def _get_next_id(cls) -> int:
@@ -88,9 +204,9 @@ class TaskManager:
             InvalidDateException: If deadline is invalid
         """
         # Check maximum limit
-        if len(self.project.tasks) >= Config.get_max_tasks():
+        if len(self.project.tasks) >= self._max_tasks:
             raise MaxLimitException(
-                f"Cannot create more than {Config.get_max_tasks()} tasks per project."
+                f"Cannot create more than {self._max_tasks} tasks per project."
             )
 
         # Validate inputs
@@ -99,7 +215,7 @@ class TaskManager:
         Validator.validate_status(status)
 
         # Validate and parse deadline
-        deadline_dt = Validator.validate_deadline(deadline)
+        deadline_date = Validator.validate_deadline(deadline)
 
         # Create task with unique ID
         task = Task(
@@ -107,22 +223,77 @@ class TaskManager:
             title=title,
             description=description,
             project_id=self.project.id,
-            deadline=deadline_dt,
+            deadline=deadline_date,
             status=status,
         )
 
         self.project.tasks.append(task)
+        self._index(task)
 
         return task
 
-    def get_all_tasks(self) -> List[Task]:
+    def bulk_load(
+        self, items: List[Tuple[str, str, Optional[str], str]]
+    ) -> List[Task]:
+        """
+        Create many tasks at once, e.g. when restoring from storage.
+
+        All items are validated before any task is added, so a failure
+        leaves the project unchanged.
+
+        Args:
+            items (List[Tuple[str, str, Optional[str], str]]):
+                (title, description, deadline, status) tuples
+
+        Returns:
+            List[Task]: Created tasks, in input order
+
+        Raises:
+            MaxLimitException: If maximum number of tasks would be exceeded
+            ValidationException: If validation fails
+            InvalidStatusException: If a status is invalid
+            InvalidDateException: If a deadline is invalid
+        """
+        max_tasks = self._max_tasks
+        if len(self.project.tasks) + len(items) > max_tasks:
+            raise MaxLimitException(
+                f"Cannot create more than {max_tasks} tasks per project."
+            )
+
+        validate_row = Validator.validate_task_row
+        deadlines = [
+            validate_row(title, description, status, deadline)
+            for title, description, deadline, status in items
+        ]
+
+        created = [
+            Task(
+                id=self._get_next_id(),
+                title=title,
+                description=description,
+                project_id=self.project.id,
+                deadline=deadline_date,
+                status=status,
+            )
+            for (title, description, _, status), deadline_date
+            in zip(items, deadlines)
+        ]
+
+        self.project.tasks.extend(created)
+        for task in created:
+            self._index(task)
+        return created
+
+    def get_all_tasks(self) -> Sequence[Task]:
         """
         Get all tasks in the project.
 
         Returns:
-            List[Task]: List of all tasks
+            Sequence[Task]: Read-only view of all tasks
         """
-        return self.project.tasks
+        if self._snapshot is None:
+            self._snapshot = tuple(self._by_id.values())
+        return self._snapshot
 
     def get_task_by_id(self, task_id: int) -> Task:
         """
@@ -137,9 +308,9 @@ class TaskManager:
         Raises:
             TaskNotFoundException: If task with given ID is not found
         """
-        for task in self.project.tasks:
-            if task.id == task_id:
-                return task
+        task = self._by_id.get(task_id)
+        if task is not None:
+            return task
 
         raise TaskNotFoundException(
             f"Task with ID {task_id} not found in project '{self.project.name}'."
@@ -158,8 +329,13 @@ class TaskManager:
         Raises:
             InvalidStatusException: If status is invalid
         """
-        Validator.validate_status(status)
-        return [task for task in self.project.tasks if task.status == status]
+        # Inline set check on the filter path (same error as Validator)
+        if status not in Validator.VALID_STATUS_SET:
+            raise InvalidStatusException(
+                f"Invalid status: '{status}'. "
+                f"Valid statuses are: {', '.join(Validator.VALID_STATUSES)}"
+            )
+        return list(self._by_status[status].values())
 
     def update_task(
         self,
@@ -201,13 +377,17 @@ class TaskManager:
             Validator.validate_status(status)
 
         # Parse deadline if provided
-        deadline_dt = None
+        deadline_date = None
         if deadline is not None:
-            deadline_dt = Validator.validate_deadline(deadline)
+            deadline_date = Validator.validate_deadline(deadline)
 
         # Update task
-        task.update(
-            title=title, description=description, deadline=deadline_dt, status=status
+        self._apply_update(
+            task,
+            title=title,
+            description=description,
+            deadline=deadline_date,
+            status=status,
         )
 
         return task
@@ -224,6 +404,11 @@ class TaskManager:
         """
         task = self.get_task_by_id(task_id)
         self.project.tasks.remove(task)
+        self._snapshot = None
+        del self._by_id[task_id]
+        self._by_status[task.status].pop(task_id, None)
+        del self._search_text[task_id]
+        self._unindex_deadline(task)
 
     def mark_task_as_done(self, task_id: int) -> Task:
         """
@@ -239,7 +424,7 @@ class TaskManager:
             TaskNotFoundException: If task is not found
         """
         task = self.get_task_by_id(task_id)
-        task.update(status="done")
+        self._apply_update(task, status="done")
         return task
 
     def get_task_count(self) -> int:
@@ -256,9 +441,12 @@ class TaskManager:
         Get all tasks that are not done.
 
         Returns:
-            List[Task]: List of pending tasks (todo or in_progress)
+            List[Task]: List of pending tasks (todo or doing), in creation
+                order
         """
-        return [task for task in self.project.tasks if task.status != "done"]
+        # Walk the ID index rather than the status buckets, which would
+        # group the result by status
+        return [task for task in self._by_id.values() if task.status != "done"]
 
     def get_overdue_tasks(self) -> List[Task]:
         """
@@ -267,13 +455,16 @@ class TaskManager:
         Returns:
             List[Task]: List of overdue tasks
         """
-        today = datetime.now().date()
+        # Deadlines before today's midnight form a prefix of the sorted
+        # index, so only overdue candidates are visited
+        today_start = datetime.combine(datetime.now().date(), time.min)
+        end = bisect_left(self._by_deadline, (today_start,))
         return [
             task
-            for task in self.project.tasks
-            if task.deadline
-            and task.deadline.date() < today
-            and task.status != "done"
+            for task in (
+                self._by_id[task_id] for _, task_id in self._by_deadline[:end]
+            )
+            if task.status != "done"
         ]
 
     def search_tasks(self, search_term: str) -> List[Task]:
@@ -288,8 +479,8 @@ class TaskManager:
         """
         search_lower = search_term.lower()
         return [
-            task
-            for task in self.project.tasks
-            if search_lower in task.title.lower()
-            or search_lower in task.description.lower()
+            self._by_id[task_id]
+            for task_id, (title_lower, description_lower)
+            in self._search_text.items()
+            if search_lower in title_lower or search_lower in description_lower
         ]
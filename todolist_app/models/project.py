@@ -5,12 +5,15 @@ This module defines the Project entity for database storage using SQLAlchemy ORM
 """
 
 from datetime import datetime
-from typing import List
-from sqlalchemy import Column, Integer, String, DateTime
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import Index, Integer, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from todolist_app.db import Base
 
+if TYPE_CHECKING:
+    from todolist_app.models.task import Task
+
 
 class Project(Base):
     """
@@ -29,24 +32,47 @@ class Project(Base):
     """
     
     __tablename__ = "projects"
+    __table_args__ = (
+        # Trigram GIN indexes let the ILIKE '%term%' search use an index
+        # instead of scanning every project (requires pg_trgm)
+        Index(
+            "ix_projects_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_projects_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, index=True, autoincrement=True
+    )
     
     # Project details
-    name = Column(String(500), nullable=False, unique=True)
-    description = Column(String(2000), nullable=True)
+    name: Mapped[str] = mapped_column(String(500), nullable=False, unique=True)
+    description: Mapped[Optional[str]] = mapped_column(
+        String(2000), nullable=True
+    )
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
     
     # Relationship with Tasks (one-to-many)
     # cascade="all, delete-orphan" means when project is deleted, all tasks are deleted too
-    tasks = relationship(
-        "Task", 
+    tasks: Mapped[List["Task"]] = relationship(
         back_populates="project", 
         cascade="all, delete-orphan",
-        lazy="selectin"  # Automatically load tasks when querying project
+        # Loaded on first access only; listings that need every project's
+        # tasks ask for selectinload explicitly (see ProjectRepository)
+        lazy="select"
     )
     
     def __repr__(self) -> str:
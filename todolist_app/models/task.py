@@ -4,18 +4,35 @@ Task model for the ToDoList application with SQLAlchemy ORM support.
 This module defines the Task entity for database storage using SQLAlchemy ORM.
 """
 
-from datetime import datetime
-from typing import Optional
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional
+from sqlalchemy import (
+    Computed,
+    Integer,
+    Index,
+    String,
+    Date,
+    DateTime,
+    text,
+    ForeignKey,
+    Enum as SQLEnum,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
 from todolist_app.db import Base
 
+if TYPE_CHECKING:
+    from todolist_app.models.project import Project
 
-class TaskStatus(enum.Enum):
+
+class TaskStatus(str, enum.Enum):
     """
     Enumeration of possible task statuses.
+
+    Members are also ``str`` instances, so they compare equal to their
+    values and API schemas can validate them natively.
     
     Attributes:
         TODO: Task is pending and not yet started
@@ -27,6 +44,19 @@ class TaskStatus(enum.Enum):
     DONE = "done"
 
 
+def _created_at_default(context) -> datetime:
+    """
+    Reuse the insert's created_at value as the initial updated_at.
+
+    Args:
+        context: SQLAlchemy execution context of the INSERT
+
+    Returns:
+        datetime: The created_at timestamp of the row being inserted
+    """
+    return context.get_current_parameters()["created_at"]
+
+
 class Task(Base):
     """
     Represents a task in the ToDoList system (ORM Entity).
@@ -40,44 +70,84 @@ class Task(Base):
         title (str): Title of the task
         description (str): Detailed description of the task
         status (TaskStatus): Current status of the task
-        deadline (Optional[datetime]): Optional deadline for the task
+        deadline (Optional[date]): Optional deadline (day precision) for the task
         created_at (datetime): Timestamp when the task was created
         updated_at (datetime): Timestamp when the task was last updated
         closed_at (Optional[datetime]): Timestamp when the task was marked as done
         project_id (int): Foreign key referencing the parent project
         project (Project): Relationship to parent project
+        search_tsv (tsvector): Generated full-text search vector over
+            title and description (deferred, used only for searching)
     """
     
     __tablename__ = "tasks"
+    __table_args__ = (
+        # GIN index so full-text search does not scan the whole table
+        Index("ix_tasks_search_tsv", "search_tsv", postgresql_using="gin"),
+        # Serves project listings and the project + status filter
+        Index("ix_tasks_project_id_status", "project_id", "status"),
+        # Partial index covering exactly the open-tasks-by-deadline scan
+        # used by the overdue queries and the autoclose job
+        Index(
+            "ix_tasks_deadline_open",
+            "deadline",
+            postgresql_where=text("status != 'DONE'"),
+        ),
+    )
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, index=True, autoincrement=True
+    )
     
     # Task details
-    title = Column(String(500), nullable=False)
-    description = Column(String(2000), nullable=False)
-    status = Column(SQLEnum(TaskStatus), default=TaskStatus.TODO, nullable=False)
-    deadline = Column(DateTime, nullable=True)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[str] = mapped_column(String(2000), nullable=False)
+    # Native Postgres ENUM (4 bytes on disk, compared as an enum not a string)
+    status: Mapped[TaskStatus] = mapped_column(
+        SQLEnum(TaskStatus, name="taskstatus", native_enum=True),
+        default=TaskStatus.TODO,
+        nullable=False
+    )
+    deadline: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime, 
-        default=datetime.utcnow, 
+        default=_created_at_default,  # One clock read per insert
         onupdate=datetime.utcnow, 
         nullable=False
     )
-    closed_at = Column(DateTime, nullable=True)
+    closed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
     
     # Foreign key to Project
-    project_id = Column(
+    project_id: Mapped[int] = mapped_column(
         Integer, 
         ForeignKey('projects.id', ondelete='CASCADE'), 
         nullable=False
     )
     
-    # Relationship with Project
-    project = relationship("Project", back_populates="tasks")
+    # Full-text search vector, maintained by Postgres (never loaded by default)
+    search_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', "
+            "coalesce(title, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+    
+    # Relationship with Project; nothing reads task.project, so a lazy load
+    # (one SELECT per task in a loop) is turned into an error instead
+    project: Mapped["Project"] = relationship(
+        back_populates="tasks", lazy="raise_on_sql"
+    )
     
     def __repr__(self) -> str:
         """
@@ -5,16 +5,32 @@ This module handles all database queries related to Project entities.
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, func, insert, select
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 
 from todolist_app.models.project import Project
+from todolist_app.models.task import Task
 from todolist_app.exceptions.repository_exceptions import (
     ProjectNotFoundException,
     DuplicateProjectException,
     DatabaseOperationException,
 )
 
+# Statements built once at import and executed with bound values, so each
+# call skips constructing the query and hits SQLAlchemy's compiled cache
+_PROJECT_BY_ID = select(Project).where(Project.id == bindparam("project_id"))
+_PROJECT_BY_NAME = select(Project).where(Project.name == bindparam("name"))
+_PROJECT_SEARCH = (
+    select(Project)
+    .where(
+        Project.name.ilike(bindparam("pattern"))
+        | Project.description.ilike(bindparam("pattern"))
+    )
+    .order_by(Project.created_at.desc())
+)
+_PROJECT_COUNT = select(func.count()).select_from(Project)
+
 
 class ProjectRepository:
     """
@@ -37,6 +53,10 @@ class ProjectRepository:
         """
         Create a new project in database.
 
+        Duplicate names are reported by the UNIQUE constraint on
+        ``projects.name``, so creating is a single INSERT with no pre-check
+        SELECT (and no race between the check and the insert).
+
         Args:
             name (str): Project name (must be unique)
             description (Optional[str]): Project description
@@ -49,30 +69,16 @@ class ProjectRepository:
             DatabaseOperationException: If database operation fails
         """
         try:
-            # Check if project with same name exists
-            existing = self.db.query(Project).filter(
-                Project.name == name
-            ).first()
-            
-            if existing:
-                raise DuplicateProjectException(
-                    f"Project with name '{name}' already exists."
-                )
-
-            # Create new project
-            project = Project(
-                name=name,
-                description=description or ""
-            )
-            
-            self.db.add(project)
+            # Create new project (INSERT ... RETURNING, no refresh SELECT)
+            project = self.db.execute(
+                insert(Project)
+                .values(name=name, description=description or "")
+                .returning(Project)
+            ).scalar_one()
             self.db.commit()
-            self.db.refresh(project)
             
             return project
             
-        except DuplicateProjectException:
-            raise
         except IntegrityError as e:
             self.db.rollback()
             raise DuplicateProjectException(
@@ -97,8 +103,8 @@ class ProjectRepository:
         Raises:
             ProjectNotFoundException: If project not found
         """
-        project = self.db.query(Project).filter(
-            Project.id == project_id
+        project = self.db.scalars(
+            _PROJECT_BY_ID, {"project_id": project_id}
         ).first()
         
         if not project:
@@ -118,19 +124,47 @@ class ProjectRepository:
         Returns:
             Optional[Project]: Found project or None
         """
-        return self.db.query(Project).filter(
-            Project.name == name
-        ).first()
+        return self.db.scalars(_PROJECT_BY_NAME, {"name": name}).first()
 
     def get_all(self) -> List[Project]:
         """
         Get all projects ordered by creation date.
 
+        Tasks are loaded with one ``SELECT ... WHERE project_id IN (...)``
+        and refreshed for projects already in the session, so
+        ``len(project.tasks)`` is current without a count query.
+
         Returns:
-            List[Project]: List of all projects
+            List[Project]: List of all projects with their tasks loaded
         """
-        return self.db.query(Project).order_by(
+        return self.db.query(Project).options(
+            selectinload(Project.tasks)
+        ).order_by(
             Project.created_at.desc()
+        ).execution_options(populate_existing=True).all()
+
+    def get_summaries(self) -> List[Row]:
+        """
+        Get plain rows for listing all projects with their task counts.
+
+        One Core ``SELECT ... LEFT JOIN tasks ... GROUP BY``; no ORM
+        instances or task rows are loaded.
+
+        Returns:
+            List[Row]: Rows with id, name, description, created_at and
+            task_count, newest project first
+        """
+        return self.db.execute(
+            select(
+                Project.id,
+                Project.name,
+                Project.description,
+                Project.created_at,
+                func.count(Task.id).label("task_count"),
+            )
+            .outerjoin(Task, Task.project_id == Project.id)
+            .group_by(Project.id)
+            .order_by(Project.created_at.desc())
         ).all()
 
     def update(
@@ -171,8 +205,9 @@ class ProjectRepository:
             if description is not None:
                 project.description = description
 
+            # No refresh: projects have no server-side onupdate columns and
+            # sessions keep state on commit, so the object is already current
             self.db.commit()
-            self.db.refresh(project)
             
             return project
             
@@ -227,10 +262,9 @@ class ProjectRepository:
             List[Project]: List of matching projects
         """
         search_pattern = f"%{query}%"
-        return self.db.query(Project).filter(
-            (Project.name.ilike(search_pattern)) |
-            (Project.description.ilike(search_pattern))
-        ).order_by(Project.created_at.desc()).all()
+        return list(
+            self.db.scalars(_PROJECT_SEARCH, {"pattern": search_pattern})
+        )
 
     def count(self) -> int:
         """
@@ -239,4 +273,4 @@ class ProjectRepository:
         Returns:
             int: Number of projects
         """
-        return self.db.query(Project).count()
+        return self.db.execute(_PROJECT_COUNT).scalar_one()
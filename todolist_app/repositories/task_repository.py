@@ -4,16 +4,94 @@ Task Repository for database operations.
 This module handles all database queries related to Task entities.
 """
 
-from typing import List, Optional
-from datetime import datetime
-from sqlalchemy.orm import Session
+from functools import cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from datetime import date, datetime
+from sqlalchemy import (
+    Row,
+    Select,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.exc import IntegrityError
 from todolist_app.models.task import Task, TaskStatus
 from todolist_app.exceptions.repository_exceptions import (
     TaskNotFoundException,
+    ProjectNotFoundException,
     DatabaseOperationException,
 )
 
+# SQLSTATE of a foreign key violation (e.g. an unknown project_id)
+FOREIGN_KEY_VIOLATION = "23503"
+
+# Columns needed by list views (mirrors the TaskInList schema)
+TASK_SUMMARY_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.status,
+    Task.deadline,
+    Task.project_id,
+)
+
+# Attributes loaded for ORM task listings; description and the other wide
+# columns stay deferred until accessed
+TASK_LIST_FIELDS = (
+    Task.id,
+    Task.title,
+    Task.status,
+    Task.deadline,
+    Task.project_id,
+    Task.created_at,
+)
+
+# Statements built once at import and executed with bound values, so each
+# call skips constructing the query and hits SQLAlchemy's compiled cache
+_TASK_BY_ID = select(Task).where(Task.id == bindparam("task_id"))
+_PENDING_BY_PROJECT = (
+    select(Task)
+    .where(
+        Task.project_id == bindparam("project_id"),
+        Task.status != TaskStatus.DONE
+    )
+    .order_by(Task.created_at.desc())
+)
+_OVERDUE_ALL = select(Task).where(
+    Task.deadline < bindparam("now"),
+    Task.status != TaskStatus.DONE
+)
+_OVERDUE_BY_PROJECT = _OVERDUE_ALL.where(
+    Task.project_id == bindparam("project_id")
+)
+_COUNT_BY_PROJECT = (
+    select(func.count())
+    .select_from(Task)
+    .where(Task.project_id == bindparam("project_id"))
+)
+
+
+@cache
+def _summary_statement(filter_by_status: bool) -> Select:
+    """
+    Build the task-summary SELECT once per filter combination.
+
+    Values are supplied as bound parameters at execution time, so the
+    statement (and SQLAlchemy's compiled form of it) is reused per call.
+    """
+    stmt = select(*TASK_SUMMARY_COLUMNS).where(
+        Task.project_id == bindparam("project_id")
+    )
+
+    if filter_by_status:
+        stmt = stmt.where(Task.status == bindparam("status"))
+
+    return stmt.order_by(Task.created_at.desc())
+
 
 class TaskRepository:
     """
@@ -37,7 +115,7 @@ class TaskRepository:
         title: str,
         description: str,
         project_id: int,
-        deadline: Optional[datetime] = None,
+        deadline: Optional[date] = None,
         status: TaskStatus = TaskStatus.TODO
     ) -> Task:
         """
@@ -47,7 +125,7 @@ class TaskRepository:
             title (str): Task title
             description (str): Task description
             project_id (int): ID of parent project
-            deadline (Optional[datetime]): Task deadline
+            deadline (Optional[date]): Task deadline
             status (TaskStatus): Initial status
 
         Returns:
@@ -57,17 +135,19 @@ class TaskRepository:
             DatabaseOperationException: If creation fails
         """
         try:
-            task = Task(
-                title=title,
-                description=description,
-                project_id=project_id,
-                deadline=deadline,
-                status=status
-            )
-            
-            self.db.add(task)
+            # INSERT ... RETURNING fills id and timestamps in one round-trip
+            task = self.db.execute(
+                insert(Task)
+                .values(
+                    title=title,
+                    description=description,
+                    project_id=project_id,
+                    deadline=deadline,
+                    status=status
+                )
+                .returning(Task)
+            ).scalar_one()
             self.db.commit()
-            self.db.refresh(task)
             
             return task
             
@@ -77,6 +157,42 @@ class TaskRepository:
                 f"Failed to create task: {str(e)}"
             )
 
+    def create_many(self, rows: List[Dict]) -> List[int]:
+        """
+        Create many tasks with a single bulk INSERT.
+
+        The rows are sent as one executemany; with RETURNING, SQLAlchemy
+        batches them into multi-row ``INSERT ... VALUES`` statements
+        ("insertmanyvalues") instead of one round-trip per task.
+
+        Args:
+            rows (List[Dict]): Column values per task (title, description,
+                project_id, and optionally deadline and status)
+
+        Returns:
+            List[int]: IDs of the created tasks, in input order
+
+        Raises:
+            DatabaseOperationException: If creation fails
+        """
+        if not rows:
+            return []
+
+        try:
+            task_ids = self.db.scalars(
+                insert(Task).returning(Task.id, sort_by_parameter_order=True),
+                rows
+            ).all()
+            self.db.commit()
+
+            return list(task_ids)
+
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseOperationException(
+                f"Failed to create tasks: {str(e)}"
+            )
+
     def get_by_id(self, task_id: int) -> Task:
         """
         Get task by ID.
@@ -90,7 +206,7 @@ class TaskRepository:
         Raises:
             TaskNotFoundException: If task not found
         """
-        task = self.db.query(Task).filter(Task.id == task_id).first()
+        task = self.db.scalars(_TASK_BY_ID, {"task_id": task_id}).first()
         
         if not task:
             raise TaskNotFoundException(
@@ -99,24 +215,30 @@ class TaskRepository:
         
         return task
 
-    def get_by_project(self, project_id: int) -> List[Task]:
+    def get_by_project(
+        self,
+        project_id: int,
+        fields: Sequence = TASK_LIST_FIELDS
+    ) -> List[Task]:
         """
         Get all tasks for a specific project.
 
         Args:
             project_id (int): Project ID
+            fields (Sequence): Task attributes to load; others are deferred
 
         Returns:
             List[Task]: List of tasks in the project
         """
-        return self.db.query(Task).filter(
+        return self.db.query(Task).options(load_only(*fields)).filter(
             Task.project_id == project_id
         ).order_by(Task.created_at.desc()).all()
 
     def get_by_status(
         self, 
         project_id: int, 
-        status: TaskStatus
+        status: TaskStatus,
+        fields: Sequence = TASK_LIST_FIELDS
     ) -> List[Task]:
         """
         Get all tasks with specific status in a project.
@@ -124,15 +246,81 @@ class TaskRepository:
         Args:
             project_id (int): Project ID
             status (TaskStatus): Status to filter by
+            fields (Sequence): Task attributes to load; others are deferred
 
         Returns:
             List[Task]: List of tasks with specified status
         """
-        return self.db.query(Task).filter(
+        return self.db.query(Task).options(load_only(*fields)).filter(
             Task.project_id == project_id,
             Task.status == status
         ).order_by(Task.created_at.desc()).all()
 
+    def get_pending_by_project(self, project_id: int) -> List[Task]:
+        """
+        Get all tasks in a project that are not done yet.
+
+        Args:
+            project_id (int): Project ID
+
+        Returns:
+            List[Task]: List of pending tasks
+        """
+        return list(
+            self.db.scalars(_PENDING_BY_PROJECT, {"project_id": project_id})
+        )
+
+    def get_summaries_by_project(
+        self,
+        project_id: int,
+        status: Optional[TaskStatus] = None
+    ) -> List[Row]:
+        """
+        Get lightweight task rows for list views.
+
+        Selects only the summary columns with a Core statement, so no ORM
+        instances (identity map, instance state, relationship loaders)
+        are built for the result.
+
+        Args:
+            project_id (int): Project ID
+            status (Optional[TaskStatus]): Status to filter by (if provided)
+
+        Returns:
+            List[Row]: Rows with id, title, status, deadline and project_id
+        """
+        params = {"project_id": project_id}
+
+        if status is not None:
+            params["status"] = status
+
+        return self.db.execute(
+            _summary_statement(status is not None), params
+        ).all()
+
+    def get_rows_by_project(self, project_id: int) -> List[Row]:
+        """
+        Get plain rows with the fields shown in a full task listing.
+
+        Args:
+            project_id (int): Project ID
+
+        Returns:
+            List[Row]: Rows with id, title, description, status and
+            deadline, newest first
+        """
+        return self.db.execute(
+            select(
+                Task.id,
+                Task.title,
+                Task.description,
+                Task.status,
+                Task.deadline,
+            )
+            .where(Task.project_id == project_id)
+            .order_by(Task.created_at.desc())
+        ).all()
+
     def get_overdue_tasks(self, project_id: Optional[int] = None) -> List[Task]:
         """
         Get all overdue tasks (deadline passed and not done).
@@ -143,71 +331,144 @@ class TaskRepository:
         Returns:
             List[Task]: List of overdue tasks
         """
-        now = datetime.utcnow()
-        query = self.db.query(Task).filter(
-            Task.deadline < now,
-            Task.status != TaskStatus.DONE
+        params = {"now": datetime.utcnow()}
+        if project_id is None:
+            stmt = _OVERDUE_ALL
+        else:
+            stmt = _OVERDUE_BY_PROJECT
+            params["project_id"] = project_id
+
+        return list(self.db.scalars(stmt, params))
+
+    def iter_overdue_tasks(
+        self,
+        project_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Row]:
+        """
+        Stream overdue tasks (deadline passed and not done) as summary rows.
+
+        Rows are fetched ``batch_size`` at a time and only the list-view
+        columns are selected, so no ORM objects enter the identity map.
+
+        Args:
+            project_id (Optional[int]): Filter by project ID (if provided)
+            batch_size (int): Rows fetched per round-trip
+
+        Returns:
+            Iterator[Row]: Rows with id, title, status, deadline, project_id
+        """
+        stmt = (
+            select(*TASK_SUMMARY_COLUMNS)
+            .where(
+                Task.deadline < datetime.utcnow(),
+                Task.status != TaskStatus.DONE
+            )
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
         )
-        
         if project_id is not None:
-            query = query.filter(Task.project_id == project_id)
-        
-        return query.all()
+            stmt = stmt.where(Task.project_id == project_id)
+
+        return iter(self.db.execute(stmt))
 
     def update(
         self,
         task_id: int,
         title: Optional[str] = None,
         description: Optional[str] = None,
-        deadline: Optional[datetime] = None,
-        status: Optional[TaskStatus] = None
+        deadline: Optional[date] = None,
+        status: Optional[TaskStatus] = None,
+        project_id: Optional[int] = None
     ) -> Task:
         """
         Update task information.
 
+        Runs as a single ``UPDATE ... RETURNING`` statement: an empty result
+        means the task does not exist, and an unknown ``project_id`` is
+        reported by the foreign key constraint instead of a pre-check SELECT.
+
         Args:
             task_id (int): ID of task to update
             title (Optional[str]): New title
             description (Optional[str]): New description
-            deadline (Optional[datetime]): New deadline
+            deadline (Optional[date]): New deadline
             status (Optional[TaskStatus]): New status
+            project_id (Optional[int]): New parent project ID
 
         Returns:
             Task: Updated task
 
         Raises:
             TaskNotFoundException: If task not found
+            ProjectNotFoundException: If new project_id does not exist
             DatabaseOperationException: If update fails
         """
+        values = {}
+
+        if title is not None:
+            values["title"] = title
+
+        if description is not None:
+            values["description"] = description
+
+        if deadline is not None:
+            values["deadline"] = deadline
+
+        if project_id is not None:
+            values["project_id"] = project_id
+
+        if status is not None:
+            values["status"] = status
+
+            # Set closed_at when task is marked as done
+            if status is TaskStatus.DONE:
+                values["closed_at"] = case(
+                    (Task.closed_at.is_(None), datetime.utcnow()),
+                    else_=Task.closed_at
+                )
+            # Clear closed_at if task is reopened
+            else:
+                values["closed_at"] = None
+
+        if not values:
+            return self.get_by_id(task_id)
+
         try:
-            task = self.get_by_id(task_id)
+            stmt = (
+                update(Task)
+                .where(Task.id == task_id)
+                .values(**values)
+                .returning(Task)
+                .execution_options(populate_existing=True)
+            )
+            task = self.db.execute(stmt).scalar_one_or_none()
 
-            if title is not None:
-                task.title = title
-            
-            if description is not None:
-                task.description = description
-            
-            if deadline is not None:
-                task.deadline = deadline
-            
-            if status is not None:
-                task.status = status
-                
-                # Set closed_at when task is marked as done
-                if status == TaskStatus.DONE and task.closed_at is None:
-                    task.closed_at = datetime.utcnow()
-                # Clear closed_at if task is reopened
-                elif status != TaskStatus.DONE:
-                    task.closed_at = None
+            if task is None:
+                self.db.rollback()
+                raise TaskNotFoundException(
+                    f"Task with ID {task_id} not found."
+                )
 
             self.db.commit()
-            self.db.refresh(task)
-            
+
             return task
-            
+
         except TaskNotFoundException:
             raise
+        except IntegrityError as e:
+            self.db.rollback()
+            # Only a move to an unknown project violates the foreign key
+            if (
+                project_id is not None
+                and getattr(e.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION
+            ):
+                raise ProjectNotFoundException(
+                    f"Project with ID {project_id} not found."
+                )
+            raise DatabaseOperationException(
+                f"Failed to update task: {str(e)}"
+            )
         except Exception as e:
             self.db.rollback()
             raise DatabaseOperationException(
@@ -218,6 +479,9 @@ class TaskRepository:
         """
         Delete task from database.
 
+        Uses ``DELETE ... RETURNING id`` so the existence check and the
+        deletion share one round-trip.
+
         Args:
             task_id (int): ID of task to delete
 
@@ -229,11 +493,18 @@ class TaskRepository:
             DatabaseOperationException: If deletion fails
         """
         try:
-            task = self.get_by_id(task_id)
-            
-            self.db.delete(task)
+            deleted_id = self.db.execute(
+                delete(Task).where(Task.id == task_id).returning(Task.id)
+            ).scalar_one_or_none()
+
+            if deleted_id is None:
+                self.db.rollback()
+                raise TaskNotFoundException(
+                    f"Task with ID {task_id} not found."
+                )
+
             self.db.commit()
-            
+
             return True
             
         except TaskNotFoundException:
@@ -259,38 +530,64 @@ class TaskRepository:
         """
         return self.update(task_id, status=TaskStatus.DONE)
 
-    def mark_as_overdue(self, task_id: int) -> Task:
+    def search(
+        self,
+        project_id: int,
+        query: str,
+        fields: Sequence = TASK_LIST_FIELDS
+    ) -> List[Task]:
         """
-        Mark task as overdue.
+        Search tasks by title or description within a project.
+
+        Uses the GIN-indexed ``search_tsv`` column (Postgres full-text
+        search), so matching is word/stem based rather than substring.
 
         Args:
-            task_id (int): ID of task to mark as overdue
+            project_id (int): Project ID to search within
+            query (str): Search term
+            fields (Sequence): Task attributes to load; others are deferred
 
         Returns:
-            Task: Updated task
-
-        Raises:
-            TaskNotFoundException: If task not found
+            List[Task]: List of matching tasks
         """
-        return self.update(task_id, status=TaskStatus.OVERDUE)
+        ts_query = func.plainto_tsquery("english", query)
+        return self.db.query(Task).options(load_only(*fields)).filter(
+            Task.project_id == project_id,
+            Task.search_tsv.op("@@")(ts_query)
+        ).order_by(Task.created_at.desc()).all()
 
-    def search(self, project_id: int, query: str) -> List[Task]:
+    def search_iter(
+        self,
+        project_id: int,
+        query: str,
+        batch_size: int = 100
+    ) -> Iterator[Task]:
         """
-        Search tasks by title or description within a project.
+        Stream tasks matching a search term within a project.
+
+        Same matching as ``search``, but rows are fetched ``batch_size`` at
+        a time through a server-side cursor instead of all at once.
 
         Args:
             project_id (int): Project ID to search within
             query (str): Search term
+            batch_size (int): Rows fetched per round-trip
 
         Returns:
-            List[Task]: List of matching tasks
+            Iterator[Task]: Matching tasks, newest first
         """
-        search_pattern = f"%{query}%"
-        return self.db.query(Task).filter(
-            Task.project_id == project_id,
-            (Task.title.ilike(search_pattern)) |
-            (Task.description.ilike(search_pattern))
-        ).order_by(Task.created_at.desc()).all()
+        ts_query = func.plainto_tsquery("english", query)
+        stmt = (
+            select(Task)
+            .where(
+                Task.project_id == project_id,
+                Task.search_tsv.op("@@")(ts_query)
+            )
+            .order_by(Task.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+
+        return iter(self.db.scalars(stmt))
 
     def count_by_project(self, project_id: int) -> int:
         """
@@ -302,28 +599,106 @@ class TaskRepository:
         Returns:
             int: Number of tasks
         """
-        return self.db.query(Task).filter(
-            Task.project_id == project_id
-        ).count()
+        return self.db.execute(
+            _COUNT_BY_PROJECT, {"project_id": project_id}
+        ).scalar_one()
 
-    def autoclose_overdue_tasks(self) -> int:
+    def has_at_least(self, project_id: int, n: int) -> bool:
+        """
+        Check whether a project has at least ``n`` tasks.
+
+        Counts over ``SELECT id ... LIMIT n``, so at most ``n`` index
+        entries are read no matter how many tasks the project has.
+
+        Args:
+            project_id (int): Project ID
+            n (int): Threshold to check
+
+        Returns:
+            bool: True if the project has ``n`` or more tasks
+        """
+        if n <= 0:
+            return True
+
+        limited = (
+            select(Task.id)
+            .where(Task.project_id == project_id)
+            .limit(n)
+            .subquery()
+        )
+        return self.db.execute(
+            select(func.count()).select_from(limited)
+        ).scalar_one() >= n
+
+    def count_by_projects(self, project_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Count tasks for several projects in one GROUP BY query.
+
+        Args:
+            project_ids (Iterable[int]): Project IDs
+
+        Returns:
+            Dict[int, int]: Task count per project ID (projects without
+            tasks are absent)
+        """
+        project_ids = list(project_ids)
+        if not project_ids:
+            return {}
+
+        rows = self.db.execute(
+            select(Task.project_id, func.count(Task.id))
+            .where(Task.project_id.in_(project_ids))
+            .group_by(Task.project_id)
+        ).all()
+
+        return {project_id: count for project_id, count in rows}
+
+    def count_by_status(self, project_id: int) -> Dict[TaskStatus, int]:
+        """
+        Count tasks per status in a project with one GROUP BY query.
+
+        Args:
+            project_id (int): Project ID
+
+        Returns:
+            Dict[TaskStatus, int]: Task count per status (statuses without
+            tasks are absent)
+        """
+        rows = self.db.execute(
+            select(Task.status, func.count(Task.id))
+            .where(Task.project_id == project_id)
+            .group_by(Task.status)
+        ).all()
+
+        return {status: count for status, count in rows}
+
+    def autoclose_overdue_tasks(self, project_id: Optional[int] = None) -> int:
         """
         Marks all overdue tasks as DONE and fills closed_at.
-        Returns number of updated tasks.
+
+        Runs as one bulk ``UPDATE ... WHERE`` (served by the partial
+        ``ix_tasks_deadline_open`` index) instead of loading every row.
+
+        Args:
+            project_id (Optional[int]): Only close tasks of this project
+
+        Returns:
+            int: Number of updated tasks
         """
         now = datetime.utcnow()
-        tasks = (
-            self.db.query(Task)
-            .filter(
+        stmt = (
+            update(Task)
+            .where(
                 Task.deadline < now,
                 Task.status != TaskStatus.DONE
             )
-            .all()
+            .values(status=TaskStatus.DONE, closed_at=now, updated_at=now)
+            .execution_options(synchronize_session=False)
         )
+        if project_id is not None:
+            stmt = stmt.where(Task.project_id == project_id)
 
-        for task in tasks:
-            task.status = TaskStatus.DONE
-            task.closed_at = now
+        result = self.db.execute(stmt)
 
         self.db.commit()
-        return len(tasks)
+        return result.rowcount
@@ -11,10 +11,20 @@ To run:
 import time
 import schedule
 from datetime import datetime
+from sqlalchemy.exc import OperationalError
 
 from todolist_app.db.session import get_db_context
 from todolist_app.services.task_service import TaskService
 
+# This process runs forever and reuses pooled connections between jobs,
+# so it validates them on checkout whatever DB_POOL_PRE_PING says
+POOL_PRE_PING = True
+
+# Attempts per job run for transient database errors (dropped connection,
+# deadlock, serialization failure), with exponential backoff between them
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+
 
 def job_autoclose_overdue():
     """
@@ -22,9 +32,18 @@ def job_autoclose_overdue():
     """
     print(f"[{datetime.now()}] Running job: autoclose overdue tasks...")
 
-    with get_db_context() as db:
-        service = TaskService(db)
-        count = service.autoclose_overdue_tasks()
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            # One short transaction: a single bulk UPDATE, then commit
+            with get_db_context(pool_pre_ping=POOL_PRE_PING) as db:
+                count = TaskService(db).autoclose_overdue_tasks()
+            break
+        except OperationalError as e:
+            if attempt == MAX_ATTEMPTS:
+                # Keep the scheduler alive; the next run will try again
+                print(f"[{datetime.now()}] ❌ Autoclose failed: {e}")
+                return
+            time.sleep(RETRY_BASE_DELAY * 2 ** (attempt - 1))
 
     print(f"[{datetime.now()}] ✔ {count} overdue tasks were automatically closed.")
 
@@ -42,7 +61,9 @@ def start_scheduler():
 
     while True:
         schedule.run_pending()
-        time.sleep(1)
+        # Sleep until the next job is due instead of waking every second
+        idle = schedule.idle_seconds()
+        time.sleep(1 if idle is None else max(idle, 0))
 
 
 if __name__ == "__main__":
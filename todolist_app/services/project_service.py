@@ -5,18 +5,45 @@ This module handles business logic for project operations,
 including validation and coordination between repositories.
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from sqlalchemy import Row, event
+from sqlalchemy.orm import Session, SessionTransaction
 
 from todolist_app.repositories.project_repository import ProjectRepository
 from todolist_app.models.project import Project
-from todolist_app.exceptions.custom_exceptions import (
+from todolist_app.exceptions import (
     ValidationException,
     MaxLimitException,
 )
 from todolist_app.utils.validators import Validator
 from todolist_app.utils.config import Config
 
+# Keys of the project caches in Session.info
+PROJECT_CACHE_KEY = "project_cache"
+PROJECT_LIST_CACHE_KEY = "project_list"
+
+# Caches dropped whenever a session's transaction ends (commit, rollback
+# or close), so a long-lived session (the CLI keeps one per process) never
+# serves projects changed elsewhere
+_TRANSACTION_CACHE_KEYS = (PROJECT_CACHE_KEY, PROJECT_LIST_CACHE_KEY)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_transaction_caches(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    """
+    Drop the project caches of a session whose transaction just ended.
+
+    Args:
+        session (Session): Session that committed, rolled back or closed
+        transaction (SessionTransaction): Transaction that ended; only the
+            outermost one clears the caches, not savepoints
+    """
+    if transaction.parent is None:
+        for key in _TRANSACTION_CACHE_KEYS:
+            session.info.pop(key, None)
+
 
 class ProjectService:
     """
@@ -35,6 +62,20 @@ class ProjectService:
             db (Session): SQLAlchemy database session
         """
         self.repository = ProjectRepository(db)
+        self._session_info = db.info
+
+    @property
+    def _cache(self) -> Dict[int, Project]:
+        """
+        Per-ID project cache of the current transaction.
+
+        Kept in Session.info, so it is shared by every service bound to
+        the session and cleared when the transaction ends.
+
+        Returns:
+            Dict[int, Project]: Cached projects by ID
+        """
+        return self._session_info.setdefault(PROJECT_CACHE_KEY, {})
 
     def create_project(
         self, 
@@ -56,24 +97,28 @@ class ProjectService:
             DuplicateProjectException: If project name exists
             MaxLimitException: If project limit exceeded
         """
+        # Validate inputs first: invalid input never costs a DB round-trip
+        Validator.validate_project_name(name)
+        Validator.validate_project_description(description or "")
+
         # Check project limit
-        max_projects = Config.get_max_projects()
+        max_projects = Config.MAX_NUMBER_OF_PROJECT
         if self.repository.count() >= max_projects:
             raise MaxLimitException(
                 f"Cannot create project. Maximum {max_projects} projects allowed."
             )
 
-        # Validate inputs
-        Validator.validate_project_name(name)
-        Validator.validate_project_description(description or "")
-
         # Create project through repository
+        self.invalidate()
         return self.repository.create(name=name, description=description)
 
     def get_project_by_id(self, project_id: int) -> Project:
         """
         Get project by ID.
 
+        Results are memoized until the current transaction ends;
+        update_project and delete_project keep the cache consistent.
+
         Args:
             project_id (int): Project ID
 
@@ -83,16 +128,49 @@ class ProjectService:
         Raises:
             ProjectNotFoundException: If project not found
         """
-        return self.repository.get_by_id(project_id)
+        project = self._cache.get(project_id)
+
+        if project is None:
+            project = self.repository.get_by_id(project_id)
+            self._cache[project_id] = project
+
+        return project
 
     def get_all_projects(self) -> List[Project]:
         """
         Get all projects.
 
+        The list is cached until the current transaction ends, a project
+        is created, updated or deleted, or invalidate() is called.
+
         Returns:
             List[Project]: List of all projects
         """
-        return self.repository.get_all()
+        projects = self._session_info.get(PROJECT_LIST_CACHE_KEY)
+
+        if projects is None:
+            projects = self.repository.get_all()
+            self._session_info[PROJECT_LIST_CACHE_KEY] = projects
+
+        return projects
+
+    def get_project_summaries(self) -> List[Row]:
+        """
+        Get plain rows (no ORM instances) for listing all projects.
+
+        Returns:
+            List[Row]: Project rows including a task_count column
+        """
+        return self.repository.get_summaries()
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached project list.
+
+        Call after writes that bypass this service but change what the
+        list shows (e.g. adding or removing tasks of a project).
+        """
+        self._session_info.pop(PROJECT_LIST_CACHE_KEY, None)
 
     def update_project(
         self,
@@ -124,6 +202,8 @@ class ProjectService:
             Validator.validate_project_description(description)
 
         # Update through repository
+        self._cache.pop(project_id, None)
+        self.invalidate()
         return self.repository.update(
             project_id=project_id,
             name=name,
@@ -143,6 +223,8 @@ class ProjectService:
         Raises:
             ProjectNotFoundException: If project not found
         """
+        self._cache.pop(project_id, None)
+        self.invalidate()
         return self.repository.delete(project_id)
 
     def search_projects(self, query: str) -> List[Project]:
@@ -5,13 +5,14 @@ This module handles business logic for task operations,
 including validation and coordination between repositories.
 """
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from datetime import date, datetime
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from todolist_app.repositories.task_repository import TaskRepository
 from todolist_app.models.task import Task, TaskStatus
-from todolist_app.exceptions.custom_exceptions import (
+from todolist_app.exceptions import (
     ValidationException,
     MaxLimitException,
 )
@@ -42,7 +43,7 @@ class TaskService:
         project_id: int,
         title: str,
         description: str,
-        deadline: Optional[str] = None,
+        deadline: Union[str, date, None] = None,
         status: str = "todo"
     ) -> Task:
         """
@@ -52,7 +53,7 @@ class TaskService:
             project_id (int): ID of parent project
             title (str): Task title
             description (str): Task description
-            deadline (Optional[str]): Deadline in YYYY-MM-DD format
+            deadline (Union[str, date, None]): Deadline (YYYY-MM-DD or date)
             status (str): Initial status (default: 'todo')
 
         Returns:
@@ -62,19 +63,20 @@ class TaskService:
             MaxLimitException: If task limit exceeded
             ValidationException: If validation fails
         """
-        # Check maximum limit
-        if self.repository.count_by_project(project_id) >= Config.get_max_tasks():
-            raise MaxLimitException(
-                f"Cannot create more than {Config.get_max_tasks()} tasks per project."
-            )
-
-        # Validate inputs
+        # Validate inputs first: invalid input never costs a DB round-trip
         Validator.validate_task_title(title)
         Validator.validate_task_description(description)
         Validator.validate_status(status)
         
-        # Parse and validate deadline
-        deadline_dt = Validator.validate_deadline(deadline)
+        # Parse and validate deadline (stored with day precision)
+        deadline_date = Validator.validate_deadline(deadline)
+
+        # Check maximum limit
+        max_tasks = Config.MAX_NUMBER_OF_TASK
+        if self.repository.has_at_least(project_id, max_tasks):
+            raise MaxLimitException(
+                f"Cannot create more than {max_tasks} tasks per project."
+            )
         
         # Convert string status to TaskStatus enum
         task_status = TaskStatus(status)
@@ -84,10 +86,53 @@ class TaskService:
             title=title,
             description=description,
             project_id=project_id,
-            deadline=deadline_dt,
+            deadline=deadline_date,
             status=task_status
         )
 
+    def create_tasks(self, project_id: int, tasks: List[Dict]) -> List[int]:
+        """
+        Create several tasks in one project with a single bulk INSERT.
+
+        Every task is validated before anything is written, and the task
+        limit is checked once for the whole batch.
+
+        Args:
+            project_id (int): ID of parent project
+            tasks (List[Dict]): Tasks as dicts with title, description and
+                optional deadline (YYYY-MM-DD or date) and status
+
+        Returns:
+            List[int]: IDs of the created tasks, in input order
+
+        Raises:
+            MaxLimitException: If the batch would exceed the task limit
+            ValidationException: If validation fails
+        """
+        validate_row = Validator.validate_task_row
+        rows = []
+        for task in tasks:
+            status = task.get("status", "todo")
+            deadline_date = validate_row(
+                task["title"], task["description"], status, task.get("deadline")
+            )
+
+            rows.append({
+                "title": task["title"],
+                "description": task["description"],
+                "project_id": project_id,
+                "deadline": deadline_date,
+                "status": TaskStatus(status),
+            })
+
+        max_tasks = Config.MAX_NUMBER_OF_TASK
+        if self.repository.has_at_least(project_id, max_tasks - len(rows) + 1):
+            raise MaxLimitException(
+                f"Cannot create more than {max_tasks} tasks per project."
+            )
+
+        return self.repository.create_many(rows)
+
     def get_task_by_id(self, task_id: int) -> Task:
         """
         Get task by ID.
@@ -137,6 +182,55 @@ class TaskService:
         task_status = TaskStatus(status)
         return self.repository.get_by_status(project_id, task_status)
 
+    def get_pending_tasks(self, project_id: int) -> List[Task]:
+        """
+        Get tasks of a project that are not done yet.
+
+        Args:
+            project_id (int): Project ID
+
+        Returns:
+            List[Task]: List of pending tasks
+        """
+        return self.repository.get_pending_by_project(project_id)
+
+    def get_task_summaries(
+        self,
+        project_id: int,
+        status: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Get summary rows (no ORM instances) for listing tasks.
+
+        Args:
+            project_id (int): Project ID
+            status (Optional[str]): Status to filter by (if provided)
+
+        Returns:
+            List[Row]: Task summary rows
+
+        Raises:
+            ValidationException: If status is invalid
+        """
+        task_status = None
+        if status is not None:
+            Validator.validate_status(status)
+            task_status = TaskStatus(status)
+
+        return self.repository.get_summaries_by_project(project_id, task_status)
+
+    def get_task_rows(self, project_id: int) -> List[Row]:
+        """
+        Get plain rows (no ORM instances) for a full task listing.
+
+        Args:
+            project_id (int): Project ID
+
+        Returns:
+            List[Row]: Task rows including the description
+        """
+        return self.repository.get_rows_by_project(project_id)
+
     def get_overdue_tasks(
         self, 
         project_id: Optional[int] = None
@@ -152,13 +246,29 @@ class TaskService:
         """
         return self.repository.get_overdue_tasks(project_id)
 
+    def iter_overdue_tasks(
+        self,
+        project_id: Optional[int] = None
+    ) -> Iterator[Row]:
+        """
+        Stream overdue tasks as lightweight summary rows.
+
+        Args:
+            project_id (Optional[int]): Filter by project (if provided)
+
+        Returns:
+            Iterator[Row]: Overdue task rows, fetched in batches
+        """
+        return self.repository.iter_overdue_tasks(project_id)
+
     def update_task(
         self,
         task_id: int,
         title: Optional[str] = None,
         description: Optional[str] = None,
-        deadline: Optional[str] = None,
-        status: Optional[str] = None
+        deadline: Union[str, date, None] = None,
+        status: Optional[str] = None,
+        project_id: Optional[int] = None
     ) -> Task:
         """
         Update task with validation.
@@ -167,14 +277,17 @@ class TaskService:
             task_id (int): ID of task to update
             title (Optional[str]): New title
             description (Optional[str]): New description
-            deadline (Optional[str]): New deadline in YYYY-MM-DD format
+            deadline (Union[str, date, None]): New deadline (YYYY-MM-DD or date)
             status (Optional[str]): New status
+            project_id (Optional[int]): New parent project ID
 
         Returns:
             Task: Updated task
 
         Raises:
             TaskNotFoundException: If task not found
+            ProjectNotFoundException: If new project_id does not exist
+            MaxLimitException: If the target project is already full
             ValidationException: If validation fails
         """
         # Validate inputs if provided
@@ -187,10 +300,23 @@ class TaskService:
         if status is not None:
             Validator.validate_status(status)
 
-        # Parse deadline if provided
-        deadline_dt = None
+        # Parse deadline if provided (stored with day precision)
+        deadline_date = None
         if deadline is not None:
-            deadline_dt = Validator.validate_deadline(deadline)
+            deadline_date = Validator.validate_deadline(deadline)
+
+        # Moving a task counts against the target project's limit, as
+        # creating one does (a task already in that project is not a move)
+        if project_id is not None:
+            max_tasks = Config.MAX_NUMBER_OF_TASK
+            if (
+                self.repository.has_at_least(project_id, max_tasks)
+                and self.repository.get_by_id(task_id).project_id != project_id
+            ):
+                raise MaxLimitException(
+                    f"Cannot move task: project {project_id} already has "
+                    f"{max_tasks} tasks."
+                )
 
         # Convert status to enum if provided
         task_status = TaskStatus(status) if status else None
@@ -200,8 +326,9 @@ class TaskService:
             task_id=task_id,
             title=title,
             description=description,
-            deadline=deadline_dt,
-            status=task_status
+            deadline=deadline_date,
+            status=task_status,
+            project_id=project_id
         )
 
     def delete_task(self, task_id: int) -> bool:
@@ -236,22 +363,18 @@ class TaskService:
 
     def mark_tasks_as_overdue(self, project_id: Optional[int] = None) -> int:
         """
-        Mark overdue tasks as overdue status.
+        Close overdue tasks with a single bulk UPDATE.
+
+        TaskStatus has no separate overdue value, so overdue tasks are
+        closed the same way the autoclose job does.
 
         Args:
             project_id (Optional[int]): Filter by project (if provided)
 
         Returns:
-            int: Number of tasks marked as overdue
+            int: Number of tasks closed
         """
-        overdue_tasks = self.get_overdue_tasks(project_id)
-        count = 0
-        
-        for task in overdue_tasks:
-            self.repository.mark_as_overdue(task.id)
-            count += 1
-        
-        return count
+        return self.repository.autoclose_overdue_tasks(project_id)
 
     def search_tasks(self, project_id: int, query: str) -> List[Task]:
         """
@@ -266,6 +389,19 @@ class TaskService:
         """
         return self.repository.search(project_id, query)
 
+    def search_tasks_iter(self, project_id: int, query: str) -> Iterator[Task]:
+        """
+        Stream tasks matching a search term, fetching rows in batches.
+
+        Args:
+            project_id (int): Project ID
+            query (str): Search term
+
+        Returns:
+            Iterator[Task]: Matching tasks
+        """
+        return self.repository.search_iter(project_id, query)
+
     def get_task_count(self, project_id: int) -> int:
         """
         Get task count for a project.
@@ -278,5 +414,36 @@ class TaskService:
         """
         return self.repository.count_by_project(project_id)
 
-    def autoclose_overdue_tasks(self):
+    def get_task_counts(self, project_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Get task counts for several projects with a single query.
+
+        Args:
+            project_ids (Iterable[int]): Project IDs
+
+        Returns:
+            Dict[int, int]: Task count per project ID (missing means 0)
+        """
+        return self.repository.count_by_projects(project_ids)
+
+    def get_status_counts(self, project_id: int) -> Dict[str, int]:
+        """
+        Get the number of tasks per status in a project.
+
+        Args:
+            project_id (int): Project ID
+
+        Returns:
+            Dict[str, int]: Task count for every status value (0 if none)
+        """
+        counts = self.repository.count_by_status(project_id)
+        return {status.value: counts.get(status, 0) for status in TaskStatus}
+
+    def autoclose_overdue_tasks(self) -> int:
+        """
+        Close every overdue task (deadline passed and not done).
+
+        Returns:
+            int: Number of tasks closed
+        """
         return self.repository.autoclose_overdue_tasks()
\ No newline at end of file
@@ -6,12 +6,92 @@ variables using python-dotenv.
 """
 
 import os
-from typing import List
+import sys
+import warnings
+from functools import cache, wraps
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Valid task statuses (from PDF: todo | doing | done), matching the
+# TaskStatus values. Kept literal: importing the model here would
+# create an import cycle (models -> db.session -> Config).
+# Ordered tuple for messages, frozenset for membership checks.
+VALID_STATUSES: Tuple[str, ...] = ("todo", "doing", "done")
+VALID_STATUS_SET: FrozenSet[str] = frozenset(VALID_STATUSES)
+
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """Load the .env file the first time any setting is read."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def _flag(value: str) -> bool:
+    """Parse a 1/true/yes environment flag."""
+    return value.lower() in ("1", "true", "yes")
+
+
+def _csv(value: str) -> List[str]:
+    """Parse a comma-separated environment list."""
+    return [item.strip() for item in value.split(",")]
+
+
+def _deprecated(replacement: str) -> Callable:
+    """
+    Mark a Config getter as deprecated in favour of a class attribute.
+
+    Args:
+        replacement (str): Attribute(s) callers should read instead
+
+    Returns:
+        Callable: Decorator that warns on each call
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            warnings.warn(
+                f"Config.{func.__name__}() is deprecated; "
+                f"read Config.{replacement} instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _EnvVar:
+    """
+    Config attribute read from the environment on first access.
+
+    The parsed value replaces the descriptor on the class, so later
+    reads are plain attribute lookups and settings nobody uses are never
+    parsed. An unset variable without a default reads as None.
+    """
+
+    def __init__(
+        self, default: Optional[str] = None, cast: Callable[[str], Any] = str
+    ):
+        self.default = default
+        self.cast = cast
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        _load_dotenv_once()
+        raw = os.getenv(self.name, self.default)
+        value = None if raw is None else self.cast(raw)
+        setattr(owner, self.name, value)
+        return value
 
 
 class Config:
@@ -20,39 +100,46 @@ class Config:
 
     This class loads configuration values from environment variables
     and provides default values when environment variables are not set.
+    Environment-backed settings are resolved lazily, on first access.
     """
 
+    # All settings live on the class; the shared ``config`` instance
+    # carries no per-instance __dict__
+    __slots__ = ()
+
     # ========== Database Configuration ==========
-    DB_USER: str = os.getenv("DB_USER")
-    DB_PASSWORD: str = os.getenv("DB_PASSWORD")
-    DB_NAME: str = os.getenv("DB_NAME")
-    DB_HOST: str = os.getenv("DB_HOST")
-    DB_PORT: str = os.getenv("DB_PORT")
+    DATABASE_URL: Optional[str] = _EnvVar()
+    DB_USER: str = _EnvVar()
+    DB_PASSWORD: str = _EnvVar()
+    DB_NAME: str = _EnvVar()
+    DB_HOST: str = _EnvVar()
+    DB_PORT: str = _EnvVar()
+    SQL_ECHO: bool = _EnvVar("", _flag)
+    DB_POOL_PRE_PING: bool = _EnvVar("", _flag)
+    DB_POOL_RECYCLE: int = _EnvVar("1800", int)
+    DB_POOL_SIZE: int = _EnvVar("5", int)
+    DB_MAX_OVERFLOW: int = _EnvVar("10", int)
+    DB_POOL_TIMEOUT: int = _EnvVar("30", int)
 
     # ========== Application Settings ==========
-    APP_NAME: str = os.getenv("APP_NAME")
-    APP_ENV: str = os.getenv("APP_ENV")
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
-    API_VERSION: str = os.getenv("API_VERSION")
+    APP_NAME: str = _EnvVar()
+    APP_ENV: str = _EnvVar()
+    DEBUG: bool = _EnvVar("false", lambda value: value.lower() == "true")
+    API_VERSION: str = _EnvVar()
 
     # ========== API Server Configuration ==========
-    API_HOST: str = os.getenv("API_HOST")
-    API_PORT: int = int(os.getenv("API_PORT"))
+    API_HOST: str = _EnvVar()
+    API_PORT: int = _EnvVar(cast=int)
 
     # ========== CORS Configuration ==========
-    CORS_ORIGINS: List[str] = [
-        origin.strip()
-        for origin in os.getenv(
-            "CORS_ORIGINS",
-        ).split(",")
-    ]
+    CORS_ORIGINS: List[str] = _EnvVar(cast=_csv)
 
     # ========== Logging Configuration ==========
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL").upper()
+    LOG_LEVEL: str = _EnvVar(cast=str.upper)
 
     # ========== Maximum Limits ==========
-    MAX_NUMBER_OF_PROJECT: int = int(os.getenv("MAX_NUMBER_OF_PROJECT"))
-    MAX_NUMBER_OF_TASK: int = int(os.getenv("MAX_NUMBER_OF_TASK"))
+    MAX_NUMBER_OF_PROJECT: int = _EnvVar(cast=int)
+    MAX_NUMBER_OF_TASK: int = _EnvVar(cast=int)
 
     # ========== Word Count Limits for Validation ==========
     # Project validation
@@ -67,16 +154,47 @@ class Config:
     TASK_DESCRIPTION_MIN_WORDS: int = 1
     TASK_DESCRIPTION_MAX_WORDS: int = 150
 
-    # Valid task statuses (from PDF: todo | doing | done)
-    VALID_STATUSES: List[str] = ["todo", "doing", "done"]
+    # (min_words, max_words) pairs, built once
+    PROJECT_NAME_LIMITS: Tuple[int, int] = (
+        PROJECT_NAME_MIN_WORDS,
+        PROJECT_NAME_MAX_WORDS,
+    )
+    PROJECT_DESCRIPTION_LIMITS: Tuple[int, int] = (
+        PROJECT_DESCRIPTION_MIN_WORDS,
+        PROJECT_DESCRIPTION_MAX_WORDS,
+    )
+    TASK_TITLE_LIMITS: Tuple[int, int] = (
+        TASK_TITLE_MIN_WORDS,
+        TASK_TITLE_MAX_WORDS,
+    )
+    TASK_DESCRIPTION_LIMITS: Tuple[int, int] = (
+        TASK_DESCRIPTION_MIN_WORDS,
+        TASK_DESCRIPTION_MAX_WORDS,
+    )
+
+    # Valid task statuses (the module-level constants)
+    VALID_STATUSES: Tuple[str, ...] = VALID_STATUSES
 
     # ========== Database Methods ==========
     @classmethod
+    @cache
     def get_database_url(cls, sync: bool = True) -> str:
+        """
+        Get the database connection URL.
+
+        Built once per ``sync`` value and memoized; call
+        ``Config.get_database_url.cache_clear()`` after changing the
+        database settings at runtime.
+
+        Args:
+            sync (bool): Use the sync driver (default) or asyncpg
+
+        Returns:
+            str: DATABASE_URL if set, else a URL built from the DB_* settings
+        """
         # Check if DATABASE_URL is explicitly set
-        database_url = os.getenv("DATABASE_URL")
-        if database_url:
-            return database_url
+        if cls.DATABASE_URL:
+            return cls.DATABASE_URL
 
         # Construct from individual components
         driver = "postgresql" if sync else "postgresql+asyncpg"
@@ -103,6 +221,7 @@ class Config:
 
     # ========== Application Methods ==========
     @classmethod
+    @_deprecated("MAX_NUMBER_OF_PROJECT")
     def get_max_projects(cls) -> int:
         """
         Get maximum number of projects allowed.
@@ -113,6 +232,7 @@ class Config:
         return cls.MAX_NUMBER_OF_PROJECT
 
     @classmethod
+    @_deprecated("MAX_NUMBER_OF_TASK")
     def get_max_tasks(cls) -> int:
         """
         Get maximum number of tasks allowed per project.
@@ -123,16 +243,21 @@ class Config:
         return cls.MAX_NUMBER_OF_TASK
 
     @classmethod
-    def get_valid_statuses(cls) -> List[str]:
+    @_deprecated("VALID_STATUSES")
+    def get_valid_statuses(cls) -> Tuple[str, ...]:
         """
-        Get list of valid task statuses.
+        Get valid task statuses.
+
+        Returns the tuple built once at class definition, so callers
+        share it and cannot mutate it.
 
         Returns:
-            List[str]: List of valid status values
+            Tuple[str, ...]: Valid status values
         """
         return cls.VALID_STATUSES
 
     @classmethod
+    @_deprecated("DEBUG")
     def is_debug_mode(cls) -> bool:
         """
         Check if application is in debug mode.
@@ -143,6 +268,7 @@ class Config:
         return cls.DEBUG
 
     @classmethod
+    @_deprecated("APP_ENV")
     def get_environment(cls) -> str:
         """
         Get current application environment.
@@ -153,6 +279,7 @@ class Config:
         return cls.APP_ENV
 
     @classmethod
+    @_deprecated("APP_NAME")
     def get_app_name(cls) -> str:
         """
         Get application name.
@@ -184,6 +311,7 @@ class Config:
 
     # ========== API Configuration Methods ==========
     @classmethod
+    @_deprecated("API_HOST")
     def get_api_host(cls) -> str:
         """
         Get API server host.
@@ -194,6 +322,7 @@ class Config:
         return cls.API_HOST
 
     @classmethod
+    @_deprecated("API_PORT")
     def get_api_port(cls) -> int:
         """
         Get API server port.
@@ -204,6 +333,7 @@ class Config:
         return cls.API_PORT
 
     @classmethod
+    @_deprecated("API_VERSION")
     def get_api_version(cls) -> str:
         """
         Get API version.
@@ -214,6 +344,7 @@ class Config:
         return cls.API_VERSION
 
     @classmethod
+    @_deprecated("CORS_ORIGINS")
     def get_cors_origins(cls) -> List[str]:
         """
         Get list of allowed CORS origins.
@@ -224,6 +355,7 @@ class Config:
         return cls.CORS_ORIGINS
 
     @classmethod
+    @_deprecated("LOG_LEVEL")
     def get_log_level(cls) -> str:
         """
         Get logging level.
@@ -247,6 +379,7 @@ class Config:
 
     # ========== Validation Limit Methods ==========
     @classmethod
+    @_deprecated("PROJECT_NAME_LIMITS")
     def get_project_name_limits(cls) -> tuple[int, int]:
         """
         Get project name word limits.
@@ -254,9 +387,10 @@ class Config:
         Returns:
             tuple[int, int]: (min_words, max_words)
         """
-        return (cls.PROJECT_NAME_MIN_WORDS, cls.PROJECT_NAME_MAX_WORDS)
+        return cls.PROJECT_NAME_LIMITS
 
     @classmethod
+    @_deprecated("PROJECT_DESCRIPTION_LIMITS")
     def get_project_description_limits(cls) -> tuple[int, int]:
         """
         Get project description word limits.
@@ -264,12 +398,10 @@ class Config:
         Returns:
             tuple[int, int]: (min_words, max_words)
         """
-        return (
-            cls.PROJECT_DESCRIPTION_MIN_WORDS,
-            cls.PROJECT_DESCRIPTION_MAX_WORDS,
-        )
+        return cls.PROJECT_DESCRIPTION_LIMITS
 
     @classmethod
+    @_deprecated("TASK_TITLE_LIMITS")
     def get_task_title_limits(cls) -> tuple[int, int]:
         """
         Get task title word limits.
@@ -277,9 +409,10 @@ class Config:
         Returns:
             tuple[int, int]: (min_words, max_words)
         """
-        return (cls.TASK_TITLE_MIN_WORDS, cls.TASK_TITLE_MAX_WORDS)
+        return cls.TASK_TITLE_LIMITS
 
     @classmethod
+    @_deprecated("TASK_DESCRIPTION_LIMITS")
     def get_task_description_limits(cls) -> tuple[int, int]:
         """
         Get task description word limits.
@@ -287,10 +420,7 @@ class Config:
         Returns:
             tuple[int, int]: (min_words, max_words)
         """
-        return (
-            cls.TASK_DESCRIPTION_MIN_WORDS,
-            cls.TASK_DESCRIPTION_MAX_WORDS,
-        )
+        return cls.TASK_DESCRIPTION_LIMITS
 
     # ========== Display Methods ==========
     @classmethod
@@ -299,43 +429,47 @@ class Config:
         Display current configuration (for debugging).
         Passwords are masked for security.
         """
-        print("=" * 60)
-        print(f"🚀 {cls.APP_NAME} Configuration")
-        print("=" * 60)
-        print(f"📌 Environment: {cls.APP_ENV}")
-        print(f"🐛 Debug Mode: {cls.DEBUG}")
-        print(f"📦 Version: {cls.API_VERSION}")
-        
-        print(f"\n🌐 API Server:")
-        print(f"  Host: {cls.API_HOST}")
-        print(f"  Port: {cls.API_PORT}")
-        print(f"  Base URL: {cls.get_api_base_url()}")
-        print(f"  Log Level: {cls.LOG_LEVEL}")
-        
-        print(f"\n🔐 CORS Origins:")
-        for origin in cls.CORS_ORIGINS:
-            print(f"  • {origin}")
-        
-        print(f"\n📊 Database:")
-        print(f"  Host: {cls.DB_HOST}:{cls.DB_PORT}")
-        print(f"  Database: {cls.DB_NAME}")
-        print(f"  User: {cls.DB_USER}")
-        print(f"  Password: {'*' * len(cls.DB_PASSWORD)}")
-        print(f"  URL: {cls.get_database_url()[:50]}...")
-        
-        print(f"\n⚙️  Business Limits:")
-        print(f"  Max Projects: {cls.MAX_NUMBER_OF_PROJECT}")
-        print(f"  Max Tasks per Project: {cls.MAX_NUMBER_OF_TASK}")
-        
-        print(f"\n📝 Validation Limits:")
-        print(f"  Project Name: {cls.PROJECT_NAME_MIN_WORDS}-{cls.PROJECT_NAME_MAX_WORDS} words")
-        print(f"  Project Description: {cls.PROJECT_DESCRIPTION_MIN_WORDS}-{cls.PROJECT_DESCRIPTION_MAX_WORDS} words")
-        print(f"  Task Title: {cls.TASK_TITLE_MIN_WORDS}-{cls.TASK_TITLE_MAX_WORDS} words")
-        print(f"  Task Description: {cls.TASK_DESCRIPTION_MIN_WORDS}-{cls.TASK_DESCRIPTION_MAX_WORDS} words")
-        
-        print(f"\n✅ Valid Task Statuses:")
-        print(f"  {' → '.join(cls.VALID_STATUSES)}")
-        print("=" * 60)
+        rule = "=" * 60
+        lines = [
+            rule,
+            f"🚀 {cls.APP_NAME} Configuration",
+            rule,
+            f"📌 Environment: {cls.APP_ENV}",
+            f"🐛 Debug Mode: {cls.DEBUG}",
+            f"📦 Version: {cls.API_VERSION}",
+            "",
+            "🌐 API Server:",
+            f"  Host: {cls.API_HOST}",
+            f"  Port: {cls.API_PORT}",
+            f"  Base URL: {cls.get_api_base_url()}",
+            f"  Log Level: {cls.LOG_LEVEL}",
+            "",
+            "🔐 CORS Origins:",
+            *(f"  • {origin}" for origin in cls.CORS_ORIGINS),
+            "",
+            "📊 Database:",
+            f"  Host: {cls.DB_HOST}:{cls.DB_PORT}",
+            f"  Database: {cls.DB_NAME}",
+            f"  User: {cls.DB_USER}",
+            f"  Password: {'*' * len(cls.DB_PASSWORD)}",
+            f"  URL: {cls.get_database_url()[:50]}...",
+            "",
+            "⚙️  Business Limits:",
+            f"  Max Projects: {cls.MAX_NUMBER_OF_PROJECT}",
+            f"  Max Tasks per Project: {cls.MAX_NUMBER_OF_TASK}",
+            "",
+            "📝 Validation Limits:",
+            f"  Project Name: {cls.PROJECT_NAME_MIN_WORDS}-{cls.PROJECT_NAME_MAX_WORDS} words",
+            f"  Project Description: {cls.PROJECT_DESCRIPTION_MIN_WORDS}-{cls.PROJECT_DESCRIPTION_MAX_WORDS} words",
+            f"  Task Title: {cls.TASK_TITLE_MIN_WORDS}-{cls.TASK_TITLE_MAX_WORDS} words",
+            f"  Task Description: {cls.TASK_DESCRIPTION_MIN_WORDS}-{cls.TASK_DESCRIPTION_MAX_WORDS} words",
+            "",
+            "✅ Valid Task Statuses:",
+            f"  {' → '.join(cls.VALID_STATUSES)}",
+            rule,
+        ]
+        # One write for the whole block instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @classmethod
     def to_dict(cls) -> dict:
@@ -370,10 +504,10 @@ class Config:
                 "max_tasks": cls.MAX_NUMBER_OF_TASK,
             },
             "validation": {
-                "project_name": cls.get_project_name_limits(),
-                "project_description": cls.get_project_description_limits(),
-                "task_title": cls.get_task_title_limits(),
-                "task_description": cls.get_task_description_limits(),
+                "project_name": cls.PROJECT_NAME_LIMITS,
+                "project_description": cls.PROJECT_DESCRIPTION_LIMITS,
+                "task_title": cls.TASK_TITLE_LIMITS,
+                "task_description": cls.TASK_DESCRIPTION_LIMITS,
                 "valid_statuses": cls.VALID_STATUSES,
             },
         }
@@ -5,27 +5,68 @@ This module provides validation functions for various input types
 including project names, task titles, descriptions, dates, and statuses.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple, Union
 
 from todolist_app.exceptions.service_exceptions import (
     InvalidDateException,
     InvalidStatusException,
     ValidationException,
 )
+from todolist_app.utils.config import VALID_STATUS_SET, VALID_STATUSES
+
+
+@lru_cache(maxsize=256)
+def _parse_ymd(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD string, memoized since the same deadline is often
+    re-validated (retries, bulk imports). date is immutable, so sharing
+    cached results is safe.
+
+    Raises:
+        ValueError: If the string is not a valid date
+    """
+    # Fast path for the canonical zero-padded shape: the C ISO parser
+    # instead of strptime's format interpreter (shape checked first so
+    # the other ISO forms fromisoformat accepts are not let through)
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        if value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit():
+            return date.fromisoformat(value)
+
+    # strptime also accepts unpadded input such as 2024-1-5
+    return datetime.strptime(value, "%Y-%m-%d").date()
 
 
 class Validator:
     """Validator class for input validation."""
 
-    # Valid task statuses
-    VALID_STATUSES = ["todo", "doing", "done"]
+    # Valid task statuses, shared with Config
+    VALID_STATUSES: Tuple[str, ...] = VALID_STATUSES
+    VALID_STATUS_SET: FrozenSet[str] = VALID_STATUS_SET
 
     # Word limits
     MAX_NAME_WORDS = 30
     MIN_NAME_WORDS = 1  # ✅ Minimum 1 word for names
     MAX_DESCRIPTION_WORDS = 150
 
+    @staticmethod
+    def _count_words(text: str, max_words: int) -> int:
+        """
+        Count words, stopping once the count is known to exceed the limit.
+
+        ``split`` with ``maxsplit`` stops splitting after ``max_words``
+        words, so a pasted wall of text costs no more than a valid one.
+
+        Args:
+            text (str): Text to count words in
+            max_words (int): Largest allowed word count
+
+        Returns:
+            int: Exact word count, or ``max_words + 1`` if it is larger
+        """
+        return len(text.split(None, max_words))
+
     @staticmethod
     def validate_project_name(name: str) -> None:
         """
@@ -37,10 +78,10 @@ class Validator:
         Raises:
             ValidationException: If validation fails
         """
-        if not name or not name.strip():
+        if not name or name.isspace():
             raise ValidationException("Project name cannot be empty.")
 
-        word_count = len(name.strip().split())
+        word_count = Validator._count_words(name, Validator.MAX_NAME_WORDS)
         
         if word_count < Validator.MIN_NAME_WORDS:
             raise ValidationException(
@@ -49,8 +90,7 @@ class Validator:
 
         if word_count > Validator.MAX_NAME_WORDS:
             raise ValidationException(
-                f"Project name cannot exceed {Validator.MAX_NAME_WORDS} words. "
-                f"Current: {word_count} words."
+                f"Project name cannot exceed {Validator.MAX_NAME_WORDS} words."
             )
 
     @staticmethod
@@ -69,12 +109,13 @@ class Validator:
             return
 
         # If provided, check word limit
-        if description.strip():
-            word_count = len(description.strip().split())
+        if description and not description.isspace():
+            word_count = Validator._count_words(
+                description, Validator.MAX_DESCRIPTION_WORDS
+            )
             if word_count > Validator.MAX_DESCRIPTION_WORDS:
                 raise ValidationException(
-                    f"Project description cannot exceed {Validator.MAX_DESCRIPTION_WORDS} words. "
-                    f"Current: {word_count} words."
+                    f"Project description cannot exceed {Validator.MAX_DESCRIPTION_WORDS} words."
                 )
 
     @staticmethod
@@ -88,10 +129,10 @@ class Validator:
         Raises:
             ValidationException: If validation fails
         """
-        if not title or not title.strip():
+        if not title or title.isspace():
             raise ValidationException("Task title cannot be empty.")
 
-        word_count = len(title.strip().split())
+        word_count = Validator._count_words(title, Validator.MAX_NAME_WORDS)
         
         if word_count < Validator.MIN_NAME_WORDS:
             raise ValidationException(
@@ -100,8 +141,7 @@ class Validator:
 
         if word_count > Validator.MAX_NAME_WORDS:
             raise ValidationException(
-                f"Task title cannot exceed {Validator.MAX_NAME_WORDS} words. "
-                f"Current: {word_count} words."
+                f"Task title cannot exceed {Validator.MAX_NAME_WORDS} words."
             )
 
     @staticmethod
@@ -116,15 +156,16 @@ class Validator:
             ValidationException: If validation fails
         """
         # ✅ Task description is still required
-        if not description or not description.strip():
+        if not description or description.isspace():
             raise ValidationException("Task description cannot be empty.")
 
-        word_count = len(description.strip().split())
+        word_count = Validator._count_words(
+            description, Validator.MAX_DESCRIPTION_WORDS
+        )
 
         if word_count > Validator.MAX_DESCRIPTION_WORDS:
             raise ValidationException(
-                f"Task description cannot exceed {Validator.MAX_DESCRIPTION_WORDS} words. "
-                f"Current: {word_count} words."
+                f"Task description cannot exceed {Validator.MAX_DESCRIPTION_WORDS} words."
             )
 
     @staticmethod
@@ -138,39 +179,81 @@ class Validator:
         Raises:
             InvalidStatusException: If status is invalid
         """
-        if status not in Validator.VALID_STATUSES:
+        if status not in VALID_STATUS_SET:
             raise InvalidStatusException(
                 f"Invalid status: '{status}'. "
-                f"Valid statuses are: {', '.join(Validator.VALID_STATUSES)}"
+                f"Valid statuses are: {', '.join(VALID_STATUSES)}"
             )
 
     @staticmethod
-    def validate_deadline(deadline: Optional[str]) -> Optional[datetime]:
+    def validate_deadline(
+        deadline: Union[str, date, None]
+    ) -> Optional[date]:
         """
         Validate and parse deadline string.
 
         Args:
-            deadline (Optional[str]): Deadline string in YYYY-MM-DD format
+            deadline (Union[str, date, None]): Deadline string in YYYY-MM-DD
+                format, or a date already parsed by the API schemas
 
         Returns:
-            Optional[datetime]: Parsed datetime object or None
+            Optional[date]: Parsed date (deadlines have day precision) or None
 
         Raises:
             InvalidDateException: If date format is invalid
         """
-        if deadline is None or deadline.strip() == "":
+        if deadline is None:
+            return None
+
+        # Single exact-type dispatch: anything but str was already parsed
+        if type(deadline) is not str:
+            if isinstance(deadline, datetime):
+                return deadline.date()
+            return deadline
+
+        value = deadline.strip()
+        if not value:
             return None
 
         try:
             # Parse the date string
-            deadline_dt = datetime.strptime(deadline.strip(), "%Y-%m-%d")
-            return deadline_dt
+            return _parse_ymd(value)
         except ValueError:
             raise InvalidDateException(
                 f"Invalid date format: '{deadline}'. "
                 f"Expected format: YYYY-MM-DD (e.g., 2024-12-31)"
             )
 
+    @staticmethod
+    def validate_task_row(
+        title: str,
+        description: str,
+        status: str,
+        deadline: Union[str, date, None],
+    ) -> Optional[date]:
+        """
+        Validate every field of one task, for bulk operations.
+
+        Args:
+            title (str): Task title
+            description (str): Task description
+            status (str): Task status
+            deadline (Union[str, date, None]): Deadline as accepted by
+                ``validate_deadline``
+
+        Returns:
+            Optional[date]: Parsed deadline or None
+
+        Raises:
+            ValidationException: If the title or description is invalid
+            InvalidStatusException: If status is invalid
+            InvalidDateException: If date format is invalid
+        """
+        Validator.validate_task_title(title)
+        Validator.validate_task_description(description)
+        Validator.validate_status(status)
+        return Validator.validate_deadline(deadline)
+
     @staticmethod
     def validate_id(entity_id: int, entity_type: str = "entity") -> None:
         """